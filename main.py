@@ -1,11 +1,19 @@
 import sympy as sp
-from metodos_numericos.polinomio_taylor import taylor, absolute_error, relative_error, graph_taylor
-from metodos_numericos.newton_raphson import newton_raphson, graph_newton_raphson
-from metodos_numericos.ecuaciones_lineales import jacobi_method
-from metodos_numericos.ecuaciones_no_lineales import newton_raphson_n_variables, graph_nonlinear_equations
+import numpy as np
+from metodos_numericos.polinomio_taylor import taylor, absolute_error, relative_error, graph_taylor, taylor_error_map, graph_taylor_error_map
+from metodos_numericos.newton_raphson import newton_raphson, graph_newton_raphson, newton_raphson_multistart, graph_newton_basins
+from metodos_numericos.ecuaciones_lineales import jacobi_method, compare_linear_solvers, print_solver_comparison
+from metodos_numericos.ecuaciones_no_lineales import newton_raphson_n_variables, broyden_n_variables, graph_nonlinear_equations
 from metodos_numericos.diferencias_finitas import solve_finite_differences, graph_finite_differences
-from metodos_numericos.biseccion import bisection_method, print_bisection_table
+from metodos_numericos.biseccion import BRACKETED_METHODS, print_bisection_table
 from metodos_numericos.lagrange import lagrange_interpolation, input_points
+from metodos_numericos.raices_polinomio import polynomial_coefficients, polynomial_roots, real_roots, print_polynomial_roots
+from metodos_numericos.interpolacion_segmentos import PiecewiseInterpolator, load_points
+from metodos_numericos.lectura_matrices import parse_matrix
+from metodos_numericos.traza_iteraciones import IterationTrace
+from metodos_numericos.cache_expresiones import parse_expression, compile_expression
+from metodos_numericos.polinomio import Polynomial
+from metodos_numericos.chebyshev import chebyshev_approximation, graph_chebyshev
 
 
 
@@ -35,16 +43,32 @@ def main():
       x_range = (x0 - x_range, x0 + x_range)
 
       # calcular el polinomio de Taylor
-      f = sp.sympify(f)
+      f = parse_expression(f)
       t = taylor(f, x0, n)
       print(t)
 
+      # polinomio numérico (Horner) para evaluar errores y graficar
+      t_poly = Polynomial.from_sympy(t, x0)
+
       # imprimir el error absoluto y relativo
-      print(f'Error absoluto: {absolute_error(f, t, x)}')
-      print(f'Error relativo: {relative_error(f, t, x)}')
+      print(f'Error absoluto: {absolute_error(f, t_poly, x)}')
+      print(f'Error relativo: {relative_error(f, t_poly, x)}')
 
       # graficar la función y el polinomio de Taylor
-      graph_taylor(f, t, x0, x_range)
+      graph_taylor(f, t_poly, x0, x_range)
+
+      # mapa de error por grado (0 a 2n) y punto del rango
+      if input("¿Graficar mapa de error por grado? (s/n): ").lower() == 's':
+        x_values = np.linspace(x_range[0], x_range[1], 500)
+        degrees = range(0, 2 * n + 1)
+        abs_err, rel_err = taylor_error_map(f, x0, x_values, degrees)
+        graph_taylor_error_map(x_values, degrees, abs_err, x0)
+
+      # comparar con la aproximación de Chebyshev en el mismo rango
+      if input("¿Comparar con aproximación de Chebyshev? (s/n): ").lower() == 's':
+        approximation = chebyshev_approximation(f, x_range[0], x_range[1])
+        print(f'Grado de Chebyshev: {approximation.degree()}')
+        graph_chebyshev(f, approximation, t_poly, x0)
 
     elif option == "2":
          # datos de entrada
@@ -56,8 +80,29 @@ def main():
       # rango de x
       x_range = (x0 - x_range, x0 + x_range)
 
+      # polinomios: todas las raíces de una vez (matriz compañera)
+      if polynomial_coefficients(f) is not None:
+        roots = polynomial_roots(f, tol)
+        print_polynomial_roots(roots)
+        graph_newton_raphson(f, list(real_roots(roots)) or [x0], x_range)
+        continue
+
+      # buscar todas las raíces del rango a la vez
+      if input("¿Buscar todas las raíces del rango? (s/n): ").strip().lower() == "s":
+        roots, starts, labels = newton_raphson_multistart(f, x_range, tol=tol)
+
+        for i, root in enumerate(roots):
+          print(f'Raíz {i + 1}: {root} ({(labels == i).sum()} puntos iniciales)')
+
+        graph_newton_basins(f, roots, starts, labels)
+        continue
+
       # calcular las raíces de la función
-      result = newton_raphson(f, x0, tol)
+      try:
+        result = newton_raphson(f, x0, tol)
+      except ValueError as e:
+        print("Error:", e)
+        continue
 
       # imprimir los resultados
       for i, x in enumerate(result):
@@ -73,9 +118,9 @@ def main():
       qx_input = input("Ingrese q(x): ")
       rx_input = input("Ingrese r(x): ")
 
-      px = sp.lambdify(x, sp.sympify(px_input), 'numpy')
-      qx = sp.lambdify(x, sp.sympify(qx_input), 'numpy')
-      rx = sp.lambdify(x, sp.sympify(rx_input), 'numpy')
+      px = compile_expression(px_input, x)
+      qx = compile_expression(qx_input, x)
+      rx = compile_expression(rx_input, x)
 
       a = float(input("Ingrese el límite inferior del intervalo: "))
       b = float(input("Ingrese el límite superior del intervalo: "))
@@ -110,9 +155,15 @@ def main():
         x0.append(float(input(f"Ingrese el valor inicial {(i+1)}: ")))
       
       n = int(input("Ingrese el número de iteraciones: "))
+      method = input("Método (newton, broyden) [newton]: ").strip() or "newton"
 
       # calcular las raíces del sistema de ecuaciones no lineales
-      result = newton_raphson_n_variables(f, x0, variables, n)
+      if method == "broyden":
+        tol = float(input("Ingrese la tolerancia: "))
+        update = input("Actualización (good, bad) [good]: ").strip() or "good"
+        result = broyden_n_variables(f, x0, variables, tol, n, update)
+      else:
+        result = newton_raphson_n_variables(f, x0, variables, n)
 
       # imprimir los resultados
       formatted_result = [[float(x) for x in y] for y in result]
@@ -126,21 +177,44 @@ def main():
 
     elif option == "5":
        # datos de entrada
-      A = input("Ingrese la matriz A: ")
-      A = sp.Matrix(eval(A))
-      b = input("Ingrese el vector b: ")
-      b = sp.Matrix(eval(b))
+      # literal como [[4, 1], [2, 5]] o ruta de un archivo .npy, .npz, .mtx o .csv
+      A = parse_matrix(input("Ingrese la matriz A (o la ruta del archivo): "))
+      b = parse_matrix(input("Ingrese el vector b (o la ruta del archivo): "))
       tol = float(input("Ingrese la tolerancia: "))
       n = int(input("Ingrese el número de iteraciones: "))
+      history = input("Historial a guardar (all, last, every, ring) [all]: ") or 'all'
+      history_size = 10
+
+      if history in ('every', 'ring'):
+        history_size = int(input("Ingrese k (paso o tamaño del historial): "))
+
+      trace_path = input("Archivo para guardar la traza (.npz, .csv o .npy; Enter para omitir): ").strip()
+      trace = IterationTrace() if trace_path else None
 
       # calcular las raíces del sistema de ecuaciones lineales
-      result = jacobi_method(A, b, tol, n)
+      result, residuals = jacobi_method(A, b, tol, n, history=history,
+                                        history_size=history_size, return_residuals=True,
+                                        trace=trace)
+
+      if trace is not None:
+        trace.save(trace_path)
+        print(f'Traza guardada en {trace_path} ({len(trace)} iteraciones)')
       
       # imprimir los resultados
       formatted_result = [[float(x) for x in y] for y in result]
 
-      for i, x in enumerate(formatted_result):
-        print(f'Iteración {i}: {x}')
+      if history == 'all':
+        for i, x in enumerate(formatted_result):
+          print(f'Iteración {i}: {x}')
+      else:
+        for i, x in enumerate(formatted_result):
+          print(f'Aproximación guardada {i}: {x}')
+
+      print(f'Iteraciones: {len(residuals)}')
+
+      # comparar con Gauss-Seidel, SOR y gradiente conjugado
+      if input("¿Comparar con otros métodos iterativos? (s/n): ").lower() == 's':
+        print_solver_comparison(compare_linear_solvers(A, b, tol, n))
         
     elif option == "6":
       f = input("Ingrese la función f(x): ")
@@ -148,18 +222,48 @@ def main():
       b = float(input("Ingrese el extremo derecho b: "))
       tol = float(input("Ingrese la tolerancia: "))
 
+      # polinomios: todas las raíces de una vez (matriz compañera)
+      if polynomial_coefficients(f) is not None:
+        roots = polynomial_roots(f, tol)
+        print_polynomial_roots(roots)
+        inside = [float(r) for r in np.unique(real_roots(roots)) if a <= r <= b]
+        print(f"\nRaíces reales en [{a}, {b}]: {inside}")
+        continue
+
+      method = input(f"Método ({', '.join(BRACKETED_METHODS)}): ").strip() or "biseccion"
+      max_evals = input("Máximo de evaluaciones de f (Enter para no limitar): ").strip()
+
       try:
-          table = bisection_method(f, a, b, tol)
-          print_bisection_table(table)
-          print(f"\nAproximación final: x ≈ {table[-1]['p']}")
+          if method not in BRACKETED_METHODS:
+              raise ValueError(f"Método desconocido: {method}")
+
+          table = BRACKETED_METHODS[method](f, a, b, tol, max_evals=int(max_evals) if max_evals else None)
+          print_bisection_table(table, f"Método: {method}")
+          print(f"\nAproximación final: x ≈ {table[-1]['p']} ({table[-1]['evals']} evaluaciones de f)")
       except ValueError as e:
           print("Error:", e)
           
     elif option == "7":
-      points = input_points()
-      P = lagrange_interpolation(points)
-      print("\nPolinomio interpolante de Lagrange:")
-      print(P)
+      path = input("Archivo de puntos x,y (Enter para ingresarlos a mano): ").strip()
+
+      if not path:
+        points = input_points()
+        P = lagrange_interpolation(points)
+        print("\nPolinomio interpolante de Lagrange:")
+        print(P)
+        continue
+
+      try:
+        points = load_points(path)
+        kind = input("Tipo de interpolación (linear, cubic, lagrange): ").strip() or "cubic"
+        order = int(input("Grado local (solo lagrange): ") or 3) if kind == "lagrange" else 3
+        interpolator = PiecewiseInterpolator(points, kind, order)
+        x_eval = parse_matrix(input("Puntos a evaluar, p. ej. [0.5, 1.5]: ")).ravel()
+
+        for xi, yi in zip(x_eval, interpolator(x_eval)):
+          print(f"P({xi}) = {yi}")
+      except ValueError as e:
+        print("Error:", e)
 
     elif option == "8":
       break
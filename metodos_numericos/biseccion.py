@@ -1,27 +1,77 @@
 # metodos_numericos/biseccion.py
-import sympy as sp
+import math
 
-def bisection_method(f, a, b, tol=1e-4, max_iter=100):
+import numpy as np
+
+from metodos_numericos.cache_expresiones import compile_expression
+
+
+def _budgeted(f, max_evals):
     """
-    Método de bisección con tabla de iteraciones
+    Envuelve f contando sus evaluaciones; al agotarse max_evals (None para
+    no limitar) la función retorna None en lugar de evaluar.
 
-    Retorna una lista de diccionarios con:
-    iter, an, bn, pn, fpn, error
+    Retorna:
+        tuple: (función envuelta, función que retorna el conteo)
     """
+    count = [0]
 
-    x = sp.symbols('x')
-    f_sym = sp.sympify(f)
-    f_func = sp.lambdify(x, f_sym, 'math')
+    def f_budget(x):
+        if max_evals is not None and count[0] >= max_evals:
+            return None
+        count[0] += 1
+        return f(x)
 
-    if f_func(a) * f_func(b) >= 0:
+    return f_budget, lambda: count[0]
+
+
+def _bracket(f, a, b, max_evals):
+    """
+    Compila f, evalúa los extremos una sola vez y verifica el cambio de signo.
+    """
+    f_func, evals = _budgeted(compile_expression(f, 'x', 'math'), max_evals)
+
+    if max_evals is not None and max_evals < 3:
+        raise ValueError("max_evals debe permitir evaluar f(a), f(b) y al menos un punto más")
+
+    fa, fb = f_func(a), f_func(b)
+
+    if fa * fb >= 0:
         raise ValueError("f(a) y f(b) deben tener signos opuestos")
 
+    return f_func, evals, fa, fb
+
+
+def _budget_exhausted(max_evals):
+    print(f"⚠ Se agotó el presupuesto de {max_evals} evaluaciones de f.")
+
+
+def bisection_method(f, a, b, tol=1e-4, max_iter=100, max_evals=None, trace=None):
+    """
+    Método de bisección con tabla de iteraciones
+
+    f(a) se guarda entre iteraciones, así que cada paso evalúa f una
+    sola vez (en el punto medio).
+
+    Retorna una lista de diccionarios con:
+    iter, an, bn, pn, fpn, error, evals
+
+    Si se da trace (IterationTrace), cada iteración se agrega también ahí.
+    """
+
+    f_func, evals, fa, fb = _bracket(f, a, b, max_evals)
+
     table = []
     n = 0
 
     while n < max_iter:
         p = (a + b) / 2
         fp = f_func(p)
+
+        if fp is None:
+            _budget_exhausted(max_evals)
+            break
+
         error = abs(b - a) / 2
 
         table.append({
@@ -30,24 +80,282 @@ def bisection_method(f, a, b, tol=1e-4, max_iter=100):
             "b": b,
             "p": p,
             "fp": fp,
-            "error": error
+            "error": error,
+            "evals": evals()
         })
 
+        if trace is not None:
+            trace.append(n, p, fp, p - table[-2]["p"] if n else np.nan, error)
+
         if error < tol:
             break
 
-        if f_func(a) * fp < 0:
+        if fa * fp < 0:
             b = p
         else:
-            a = p
+            a, fa = p, fp
 
         n += 1
 
     return table
 
 
-def print_bisection_table(table):
-    print("\nMétodo de Bisección")
+def bisection_batch(f, a, b, tol=1e-4, max_iter=100, parameter=None, parameter_name='k'):
+    """
+    Bisección vectorizada sobre arreglos de intervalos [a_i, b_i].
+
+    Todos los intervalos avanzan a la vez: en cada iteración f se evalúa
+    con NumPy solo en los carriles que aún no convergieron. Si se da
+    parameter, f depende de x y de parameter_name, y cada carril usa su
+    propio valor (a, b y parameter se combinan con broadcasting), así que
+    resolver la misma ecuación paramétrica para miles de valores es una
+    sola operación con arreglos.
+
+    Parámetros:
+        f: función de x (o de x y parameter_name)
+        a, b: extremos de los intervalos (escalares o arreglos)
+        tol: tolerancia del error |b - a| / 2
+        max_iter: máximo de iteraciones
+        parameter: arreglo de valores del parámetro (opcional)
+        parameter_name: nombre del parámetro dentro de f
+
+    Retorna:
+        tuple: (roots, iterations)
+            roots → aproximación de cada carril (NaN si f(a) y f(b) no
+                    tienen signos opuestos)
+            iterations → iteraciones realizadas por cada carril
+    """
+
+    if parameter is None:
+        a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+        f_func = compile_expression(f, 'x')
+        values = None
+    else:
+        a, b, values = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float),
+                                           np.asarray(parameter, dtype=float))
+        f_func = compile_expression(f, ('x', parameter_name))
+        values = values.ravel()
+
+    def evaluate(x, index):
+        result = f_func(x) if values is None else f_func(x, values[index])
+        return np.broadcast_to(result, x.shape).astype(float)
+
+    shape = a.shape
+
+    # Se ordena cada intervalo para que b - a (y el error) no sea negativo
+    a, b = np.minimum(a, b).ravel(), np.maximum(a, b).ravel()
+
+    roots = (a + b) / 2
+    iterations = np.zeros(a.shape, dtype=int)
+
+    everything = np.arange(len(a))
+    fa = evaluate(a, everything)
+    fb = evaluate(b, everything)
+
+    valid = fa * fb < 0
+    roots[~valid] = np.nan
+
+    if not valid.all():
+        print(f"⚠ {np.sum(~valid)} intervalos sin cambio de signo quedan como NaN.")
+
+    active = valid.copy()
+
+    for n in range(max_iter):
+        index = np.flatnonzero(active)
+
+        if len(index) == 0:
+            break
+
+        p = (a[index] + b[index]) / 2
+        fp = evaluate(p, index)
+        error = (b[index] - a[index]) / 2
+
+        roots[index] = p
+        iterations[index] = n + 1
+
+        done = (error < tol) | (fp == 0)
+        left = fa[index] * fp < 0
+
+        b[index[left]] = p[left]
+        a[index[~left]] = p[~left]
+        fa[index[~left]] = fp[~left]
+
+        active[index[done]] = False
+
+    return roots.reshape(shape), iterations.reshape(shape)
+
+
+def regula_falsi_method(f, a, b, tol=1e-4, max_iter=100, max_evals=None, illinois=True,
+                        trace=None):
+    """
+    Método de la regla falsa (posición falsa) con tabla de iteraciones.
+
+    Con illinois=True, cuando el mismo extremo se conserva dos veces
+    seguidas su valor de f se divide entre 2, lo que evita que un extremo
+    quede fijo y mantiene convergencia superlineal.
+
+    El error de cada fila es |p_n - p_{n-1}| (|b - a| en la primera).
+
+    Retorna una lista de diccionarios con:
+    iter, an, bn, pn, fpn, error, evals
+
+    Si se da trace (IterationTrace), cada iteración se agrega también ahí.
+    """
+
+    f_func, evals, fa, fb = _bracket(f, a, b, max_evals)
+
+    table = []
+    p_previous = None
+    side = 0
+    n = 0
+
+    while n < max_iter:
+        p = (a * fb - b * fa) / (fb - fa)
+        fp = f_func(p)
+
+        if fp is None:
+            _budget_exhausted(max_evals)
+            break
+
+        error = abs(b - a) if p_previous is None else abs(p - p_previous)
+
+        table.append({
+            "iter": n,
+            "a": a,
+            "b": b,
+            "p": p,
+            "fp": fp,
+            "error": error,
+            "evals": evals()
+        })
+
+        if trace is not None:
+            trace.append(n, p, fp, np.nan if p_previous is None else p - p_previous, error)
+
+        if error < tol or fp == 0:
+            break
+
+        if fa * fp < 0:
+            b, fb = p, fp
+            if illinois and side == -1:
+                fa /= 2
+            side = -1
+        else:
+            a, fa = p, fp
+            if illinois and side == 1:
+                fb /= 2
+            side = 1
+
+        p_previous = p
+        n += 1
+
+    return table
+
+
+def brent_method(f, a, b, tol=1e-4, max_iter=100, max_evals=None, trace=None):
+    """
+    Método de Brent: combina interpolación cuadrática inversa, secante y
+    bisección. Usa la interpolación cuando el paso propuesto cae dentro del
+    intervalo y reduce lo suficiente el anterior; si no, biseca. Conserva
+    la garantía de la bisección con convergencia superlineal para f suave.
+
+    En cada fila p es la mejor aproximación (el extremo con menor |f|) y el
+    error es el ancho del intervalo que encierra la raíz.
+
+    Retorna una lista de diccionarios con:
+    iter, an, bn, pn, fpn, error, evals
+
+    Si se da trace (IterationTrace), cada iteración se agrega también ahí.
+    """
+
+    f_func, evals, fa, fb = _bracket(f, a, b, max_evals)
+
+    # b es siempre el extremo con menor |f|
+    if abs(fa) < abs(fb):
+        a, b, fa, fb = b, a, fb, fa
+
+    c, fc = a, fa
+    d = c
+    bisected = True
+
+    table = []
+    n = 0
+
+    while n < max_iter:
+        if fa != fc and fb != fc:
+            # interpolación cuadrática inversa
+            s = (a * fb * fc / ((fa - fb) * (fa - fc))
+                 + b * fa * fc / ((fb - fa) * (fb - fc))
+                 + c * fa * fb / ((fc - fa) * (fc - fb)))
+        else:
+            # secante
+            s = b - fb * (b - a) / (fb - fa)
+
+        if (not min((3 * a + b) / 4, b) < s < max((3 * a + b) / 4, b)
+                or (bisected and abs(s - b) >= abs(b - c) / 2)
+                or (not bisected and abs(s - b) >= abs(c - d) / 2)
+                or (bisected and abs(b - c) < tol)
+                or (not bisected and abs(c - d) < tol)):
+            s = (a + b) / 2
+            bisected = True
+        else:
+            bisected = False
+
+            # paso mínimo de tol / 2 hacia el otro extremo, para que el
+            # intervalo se cierre también del lado que no se mueve
+            if abs(s - b) < tol / 2:
+                s = b + math.copysign(tol / 2, a - b)
+
+        fs = f_func(s)
+
+        if fs is None:
+            _budget_exhausted(max_evals)
+            break
+
+        d, c, fc = c, b, fb
+
+        if fa * fs < 0:
+            b, fb = s, fs
+        else:
+            a, fa = s, fs
+
+        if abs(fa) < abs(fb):
+            a, b, fa, fb = b, a, fb, fa
+
+        error = abs(b - a)
+
+        table.append({
+            "iter": n,
+            "a": min(a, b),
+            "b": max(a, b),
+            "p": b,
+            "fp": fb,
+            "error": error,
+            "evals": evals()
+        })
+
+        if trace is not None:
+            trace.append(n, b, fb, b - table[-2]["p"] if n else np.nan, error)
+
+        if error < tol or fb == 0:
+            break
+
+        n += 1
+
+    return table
+
+
+# Métodos con intervalo disponibles por nombre (menú y ventana)
+BRACKETED_METHODS = {
+    "biseccion": bisection_method,
+    "regula_falsi": lambda *args, **kwargs: regula_falsi_method(*args, illinois=False, **kwargs),
+    "illinois": regula_falsi_method,
+    "brent": brent_method
+}
+
+
+def print_bisection_table(table, title="Método de Bisección"):
+    print(f"\n{title}")
     print("-" * 85)
     print(f"{'n':<5}{'an':<15}{'bn':<15}{'pn':<15}{'f(pn)':<15}{'Error':<15}")
     print("-" * 85)
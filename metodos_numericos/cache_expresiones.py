@@ -0,0 +1,256 @@
+from collections import OrderedDict
+from threading import Lock
+
+import numpy as np
+import sympy as sp
+
+
+class ExpressionCache:
+    """
+    Caché LRU de tamaño acotado con contadores de aciertos y fallos.
+
+    Al superar maxsize se descarta la entrada usada hace más tiempo.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, compute):
+        """
+        Retorna el valor guardado para key o lo calcula con compute().
+
+        compute se ejecuta fuera del candado, así que puede usar la caché
+        (p. ej. una derivada de orden n a partir de la de orden n - 1).
+        """
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]
+
+            self.misses += 1
+
+        value = compute()
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+        return value
+
+    def info(self):
+        """
+        Retorna un diccionario con hits, misses, size y maxsize.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._data),
+                "maxsize": self.maxsize
+            }
+
+    def clear(self):
+        """
+        Vacía la caché y reinicia los contadores.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Caché compartida por todos los métodos del proceso
+_cache = ExpressionCache()
+
+
+def _as_symbols(variables):
+    """
+    Normaliza las variables ('x', ('x0', 'x1'), símbolos de SymPy...) a una
+    tupla de símbolos.
+    """
+    if isinstance(variables, (str, sp.Symbol)):
+        variables = (variables,)
+
+    return tuple(sp.Symbol(v) if isinstance(v, str) else v for v in variables)
+
+
+def parse_expression(f):
+    """
+    Convierte el texto de una función en expresión de SymPy (sympify),
+    reutilizando el resultado si el mismo texto ya se analizó.
+
+    Parámetros:
+        f (str o expresión de SymPy): Función a analizar.
+
+    Retorna:
+        Expresión de SymPy.
+    """
+    if not isinstance(f, str):
+        return sp.sympify(f)
+
+    return _cache.get(('parse', f), lambda: sp.sympify(f))
+
+
+def get_derivative(f, variable='x', order=1):
+    """
+    Retorna la derivada simbólica de orden order de f respecto a variable.
+
+    Cada orden se obtiene derivando una vez el anterior (también guardado
+    en la caché), así que las derivadas sucesivas no se recalculan.
+    """
+    expr = parse_expression(f)
+    (var,) = _as_symbols(variable)
+
+    if order == 0:
+        return expr
+
+    return _cache.get(
+        ('diff', expr, var, order),
+        lambda: sp.diff(get_derivative(expr, var, order - 1), var)
+    )
+
+
+def compile_expression(f, variables='x', backend='numpy', order=0):
+    """
+    Retorna la función numérica (lambdify) de f o de su derivada de orden
+    order respecto a la primera variable.
+
+    La caché usa como clave (expresión, variables, backend, orden), de modo
+    que resolver y luego graficar la misma función compila una sola vez.
+
+    Parámetros:
+        f (str o expresión de SymPy): Función.
+        variables: Variable o tupla de variables ('x', ('x0', 'x1'), ...).
+        backend (str): Módulo de lambdify ('numpy', 'math', ...).
+        order (int): Orden de la derivada (0 para la función misma).
+
+    Retorna:
+        function: Función numérica compilada.
+    """
+    expr = parse_expression(f)
+    symbols = _as_symbols(variables)
+
+    return _cache.get(
+        ('lambdify', expr, symbols, backend, order),
+        lambda: sp.lambdify(symbols, get_derivative(expr, symbols[0], order), backend)
+    )
+
+
+def compile_value_and_derivative(f, variable='x', backend='numpy'):
+    """
+    Retorna una sola función numérica que calcula f y su primera derivada a
+    la vez, compilada con eliminación de subexpresiones comunes (cse), de
+    modo que lo que comparten f y f' se evalúa una única vez.
+
+    Parámetros:
+        f (str o expresión de SymPy): Función.
+        variable: Variable de derivación.
+        backend (str): Módulo de lambdify.
+
+    Retorna:
+        function: g(x) → [f(x), f'(x)].
+    """
+    expr = parse_expression(f)
+    symbols = _as_symbols(variable)
+
+    return _cache.get(
+        ('value_and_derivative', expr, symbols, backend),
+        lambda: sp.lambdify(symbols, [expr, get_derivative(expr, symbols[0])], backend, cse=True)
+    )
+
+
+def compile_residual_jacobian(functions, variables, backend='numpy'):
+    """
+    Compila un sistema de funciones en un solo kernel que retorna a la vez
+    el vector de residuos y los elementos no nulos de la jacobiana, con
+    eliminación de subexpresiones comunes (cse) entre todos ellos.
+
+    La estructura de la jacobiana se detecta a partir de las variables que
+    aparecen en cada función: solo se derivan (y se evalúan) las parciales
+    que no son idénticamente cero, de modo que en sistemas grandes donde
+    cada ecuación toca pocas variables el costo crece con el número de
+    elementos no nulos y no con n².
+
+    Parámetros:
+        functions (list): Funciones del sistema (texto o SymPy).
+        variables: Tupla de variables ('x0', 'x1', ...).
+        backend (str): Módulo de lambdify.
+
+    Retorna:
+        tuple: (kernel, rows, cols)
+            kernel(x) → (residuos, valores de la jacobiana), con x un arreglo
+            rows, cols → posiciones (fila, columna) de cada valor de la jacobiana
+    """
+    functions = tuple(functions)
+    symbols = _as_symbols(variables)
+
+    def compute():
+        # Sin pasar por parse_expression: miles de ecuaciones desplazarían
+        # de la caché a todas las demás entradas (incluido este kernel)
+        exprs = [sp.sympify(f) for f in functions]
+        position = {var: j for j, var in enumerate(symbols)}
+        rows, cols, entries = [], [], []
+
+        for i, expr in enumerate(exprs):
+            for var in sorted(expr.free_symbols & set(symbols), key=position.get):
+                # Derivada término a término, solo de los sumandos que
+                # contienen var (mucho más rápido que diff sobre la suma
+                # completa cuando hay miles de ecuaciones)
+                terms = expr.args if expr.is_Add else (expr,)
+                derivative = sp.Add(*[t.diff(var) for t in terms if var in t.free_symbols])
+
+                if derivative != 0:
+                    rows.append(i)
+                    cols.append(position[var])
+                    entries.append(derivative)
+
+        kernel = sp.lambdify([symbols], [exprs, entries], backend, cse=True)
+        return kernel, np.array(rows, dtype=int), np.array(cols, dtype=int)
+
+    return _cache.get(('residual_jacobian', functions, symbols, backend), compute)
+
+
+def compile_residuals(functions, variables, backend='numpy'):
+    """
+    Compila solo el vector de residuos de un sistema en un kernel con cse,
+    para los métodos que no evalúan la jacobiana en cada iteración.
+
+    Retorna:
+        function: F(x) → lista de residuos, con x un arreglo.
+    """
+    functions = tuple(functions)
+    symbols = _as_symbols(variables)
+
+    return _cache.get(
+        ('residuals', functions, symbols, backend),
+        lambda: sp.lambdify([symbols], [sp.sympify(f) for f in functions], backend, cse=True)
+    )
+
+
+def cache_info():
+    """
+    Retorna las estadísticas de la caché compartida (hits, misses, size, maxsize).
+    """
+    return _cache.info()
+
+
+def cache_clear():
+    """
+    Vacía la caché compartida.
+    """
+    _cache.clear()
+
+
+def set_cache_size(maxsize):
+    """
+    Cambia el número máximo de entradas de la caché compartida.
+    """
+    _cache.maxsize = maxsize
@@ -0,0 +1,135 @@
+import matplotlib.pyplot as plt
+import numpy as np
+from numpy.polynomial import Chebyshev
+from scipy.fft import dct
+
+from metodos_numericos.cache_expresiones import compile_expression
+from metodos_numericos.polinomio import as_polynomial
+
+
+# ============================================================
+#   COEFICIENTES DE CHEBYSHEV
+# ============================================================
+
+def chebyshev_coefficients(f, a, b, n):
+    """
+    Calcula los coeficientes de la interpolación de f en n nodos de
+    Chebyshev del intervalo [a, b] con una transformada discreta del
+    coseno (DCT-II), en O(n log n).
+
+    Parámetros:
+        f : función simbólica de SymPy (o texto)
+        a, b : extremos del intervalo
+        n : número de nodos (el grado resultante es n - 1)
+
+    Retorna:
+        ndarray: coeficientes [c_0, ..., c_{n-1}] en la base T_k
+    """
+    f_numeric = compile_expression(f, 'x')
+
+    # Nodos de Chebyshev (de primera especie) llevados a [a, b]
+    nodes = np.cos(np.pi * (np.arange(n) + 0.5) / n)
+    x_values = (a + b) / 2 + (b - a) / 2 * nodes
+    f_values = np.broadcast_to(f_numeric(x_values), x_values.shape).astype(float)
+
+    coefficients = dct(f_values, type=2) / n
+    coefficients[0] /= 2
+
+    return coefficients
+
+
+# ============================================================
+#   APROXIMACIÓN ADAPTATIVA
+# ============================================================
+
+def chebyshev_approximation(f, a, b, tol=1e-12, max_degree=2**16):
+    """
+    Aproxima f en [a, b] con una serie de Chebyshev cuyo grado se elige
+    automáticamente: el número de nodos se duplica hasta que los últimos
+    coeficientes caen por debajo de tol (relativo al mayor), y la serie se
+    recorta en el último coeficiente significativo.
+
+    Parámetros:
+        f          : función simbólica de SymPy (o texto)
+        a, b       : extremos del intervalo
+        tol        : tolerancia relativa de los coeficientes
+        max_degree : grado máximo permitido
+
+    Retorna:
+        numpy.polynomial.Chebyshev: aproximación evaluable sobre arreglos
+        (con dominio [a, b]); .degree() da el grado elegido
+    """
+    n = 16
+
+    while True:
+        coefficients = chebyshev_coefficients(f, a, b, n)
+        scale = np.abs(coefficients).max()
+        tail = np.abs(coefficients[-max(2, n // 8):])
+
+        if scale == 0 or tail.max() <= tol * scale:
+            break
+
+        if n > max_degree:
+            print("⚠ Los coeficientes no decayeron hasta la tolerancia con el grado máximo.")
+            break
+
+        n = min(2 * n, max_degree + 1)
+
+    # Recortar los coeficientes despreciables del final
+    significant = np.nonzero(np.abs(coefficients) > tol * scale)[0]
+    last = significant[-1] if len(significant) else 0
+
+    return Chebyshev(coefficients[:last + 1], domain=[a, b])
+
+
+# ============================================================
+#   GRÁFICA CHEBYSHEV vs TAYLOR
+# ============================================================
+
+def graph_chebyshev(f, approximation, t=None, x0=None):
+    """
+    Gráfica la función original f, su aproximación de Chebyshev y, si se
+    da, el polinomio de Taylor t, junto con el error de cada aproximación.
+
+    Parámetros:
+        f             : función simbólica
+        approximation : resultado de chebyshev_approximation
+        t             : polinomio de Taylor (Polynomial o simbólico), opcional
+        x0            : punto de aproximación de Taylor (necesario si t es
+                        simbólico), opcional
+    """
+    a, b = approximation.domain
+    x_vals = np.linspace(a, b, 500)
+
+    f_numeric = compile_expression(f, 'x')
+    f_vals = np.broadcast_to(f_numeric(x_vals), x_vals.shape)
+    c_vals = approximation(x_vals)
+
+    fig, (ax_f, ax_e) = plt.subplots(2, 1, sharex=True)
+
+    ax_f.plot(x_vals, f_vals, label="Función original f(x)", linewidth=2)
+    ax_f.plot(x_vals, c_vals, "--", label=f"Chebyshev (grado {approximation.degree()})", linewidth=2)
+    ax_e.semilogy(x_vals, np.abs(f_vals - c_vals), label="Error Chebyshev")
+
+    if t is not None:
+        t_numeric = as_polynomial(t, x0)
+        t_vals = t_numeric(x_vals)
+
+        ax_f.plot(x_vals, t_vals, ":", label=f"Taylor (grado {t_numeric.degree})", linewidth=2)
+        ax_e.semilogy(x_vals, np.abs(f_vals - t_vals), label="Error Taylor")
+
+        if x0 is not None:
+            ax_f.scatter([x0], [f_numeric(x0)], color='black', label="Punto x0")
+
+    # estilo
+    ax_f.set_title("Aproximación de Chebyshev vs Polinomio de Taylor")
+    ax_f.set_ylabel("y")
+    ax_f.grid(alpha=0.3)
+    ax_f.legend()
+
+    ax_e.set_xlabel("x")
+    ax_e.set_ylabel("|error|")
+    ax_e.grid(alpha=0.3)
+    ax_e.legend()
+
+    plt.show()
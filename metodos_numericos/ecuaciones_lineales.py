@@ -1,6 +1,143 @@
+from collections import deque
+
 import numpy as np
+import scipy.sparse as sparse
+from scipy.linalg import solve_triangular
+from scipy.sparse.linalg import spsolve_triangular
+
+
+def prepare_system(A, b):
+    """
+    Convierte A y b a arreglos NumPy de tipo float (A queda en formato CSR
+    si es una matriz dispersa de SciPy) y devuelve también la diagonal de A.
+    Los arreglos que ya son float, como los cargados con lectura_matrices,
+    se usan sin copiarlos.
+    """
+    if sparse.issparse(A):
+        A_np = sparse.csr_matrix(A, dtype=float)
+    else:
+        # asarray no copia arreglos que ya son float (p. ej. mapeados en memoria)
+        A_np = np.asarray(A, dtype=float)
+
+    if sparse.issparse(b):
+        b = b.toarray()
+    b_np = np.asarray(b, dtype=float).ravel()
+
+    D = A_np.diagonal()
+
+    if np.any(D == 0):
+        raise ValueError("La diagonal de A no debe tener ceros")
+
+    return A_np, b_np, D
+
+
+def jacobi_iterations(A, b, max_iter=100):
+    """
+    Generador con las iteraciones del método de Jacobi.
+
+    Permite procesar cada aproximación a medida que se calcula sin
+    guardar el historial completo.
+
+    Parámetros:
+        A, b: Sistema Ax = b (ver jacobi_method).
+        max_iter (int): Número máximo de iteraciones.
+
+    Produce:
+        tuple: (k, x_new, step, residual)
+            - k        → número de la iteración (desde 1)
+            - x_new    → aproximación x^(k) (arreglo NumPy, no se copia)
+            - step     → norma infinito de x^(k) - x^(k-1)
+            - residual → norma infinito del residuo b - A·x^(k)
+    """
+
+    A_np, b_np, D = prepare_system(A, b)
 
-def jacobi_method(A, b, tol=1e-4, max_iter=100):
+    # Aproximación inicial: vector de ceros
+    x = np.zeros(len(b_np), dtype=float)
+
+    # Se hace un barrido más que max_iter: el residuo de x^(k) se obtiene
+    # al calcular x^(k+1), así que cada aproximación se entrega un paso después
+    for k in range(1, max_iter + 2):
+        # Fórmula del método de Jacobi: x^(k+1) = (b - R·x^(k)) / D,
+        # con R·x = A·x - D·x (un solo producto matriz-vector por iteración)
+        x_new = (b_np - (A_np @ x - D * x)) / D
+
+        # b - A·x = D·(x_new - x), así que el residuo no cuesta otro producto
+        delta = x_new - x
+
+        if k > 1:
+            yield k - 1, x, step, np.linalg.norm(D * delta, ord=np.inf)
+
+        step = np.linalg.norm(delta, ord=np.inf)
+        x = x_new
+
+
+def run_iterations(iterations, n, tol, max_iter, history, history_size,
+                   callback, return_residuals, trace=None):
+    """
+    Recorre un generador de iteraciones (k, x, step, residual) aplicando el
+    criterio de parada y la política de historial comunes a todos los
+    métodos iterativos (ver jacobi_method), incluido el Jacobi paralelo de
+    jacobi_paralelo.
+    """
+
+    if history not in ('all', 'last', 'every', 'ring'):
+        raise ValueError("history debe ser 'all', 'last', 'every' o 'ring'")
+
+    if history_size < 1:
+        raise ValueError("history_size debe ser al menos 1")
+
+    # Contenedor del historial según la política elegida
+    if history == 'ring':
+        results = deque(maxlen=history_size)
+    else:
+        results = []
+
+    x = np.zeros(n, dtype=float)
+    if history != 'last':
+        results.append(list(x))  # Guardar la primera aproximación
+
+    residuals = np.empty(max_iter)
+    converged = False
+    k = 0
+
+    # Iteraciones del método
+    for k, x, step, residual in iterations:
+        residuals[k - 1] = residual
+
+        if callback is not None:
+            callback(k, x, residual)
+
+        if trace is not None:
+            trace.append(k, x, residual, step, step)
+
+        # Guardar la aproximación de esta iteración
+        if history in ('all', 'ring') or (history == 'every' and k % history_size == 0):
+            results.append(list(x))
+
+        # Verificar convergencia usando norma infinito
+        if step < tol:
+            converged = True
+            break
+
+    # La aproximación final siempre queda en el historial
+    if history == 'last' or (history == 'every' and k % history_size != 0):
+        results.append(list(x))
+
+    if not converged:
+        # Si se alcanza el máximo de iteraciones sin converger
+        print("⚠ El método no convergió en el número máximo de iteraciones.")
+
+    results = list(results)
+
+    if return_residuals:
+        return results, residuals[:k]
+
+    return results
+
+
+def jacobi_method(A, b, tol=1e-4, max_iter=100, history='all', history_size=10,
+                  callback=None, return_residuals=False, trace=None):
     """
     Método de Jacobi para resolver sistemas lineales de la forma Ax = b.
 
@@ -9,8 +146,10 @@ def jacobi_method(A, b, tol=1e-4, max_iter=100):
     principal del método de Jacobi).
 
     Parámetros:
-        A (matrix o lista de listas):
-            Matriz de coeficientes del sistema.
+        A (matrix, lista de listas o matriz dispersa de SciPy):
+            Matriz de coeficientes del sistema. Las matrices dispersas
+            (CSR, COO, ...) se usan sin convertirlas a densas, de modo que
+            cada iteración solo recorre los elementos no nulos.
 
         b (vector o lista):
             Vector de términos independientes.
@@ -22,45 +161,294 @@ def jacobi_method(A, b, tol=1e-4, max_iter=100):
         max_iter (int):
             Número máximo de iteraciones permitidas.
 
+        history (str):
+            Aproximaciones que se guardan en el resultado:
+            - 'all'   → todas (por defecto)
+            - 'last'  → solo la aproximación final
+            - 'every' → la inicial, una de cada history_size iteraciones y la final
+            - 'ring'  → las últimas history_size aproximaciones
+
+        history_size (int):
+            Paso del modo 'every' o capacidad del modo 'ring'.
+
+        callback (function):
+            Función opcional callback(k, x, residual) llamada en cada
+            iteración; permite procesar las aproximaciones en flujo sin
+            guardarlas. x es un arreglo NumPy que no debe modificarse.
+
+        return_residuals (bool):
+            Si es True, retorna además un arreglo NumPy con la norma infinito
+            del residuo b - A·x^(k) de cada aproximación x^(k) generada.
+
+        trace (IterationTrace):
+            Traza opcional donde se agrega cada iteración (aproximación,
+            norma del residuo y norma infinito del paso, que es también el
+            error comparado con tol).
+
     Retorna:
         list:
-            Lista que contiene todas las aproximaciones generadas en cada
-            iteración, incluidas la inicial (vector cero) y la aproximación final.
+            Lista con las aproximaciones guardadas según history; con 'all'
+            contiene todas las generadas en cada iteración, incluidas la
+            inicial (vector cero) y la aproximación final.
+        Si return_residuals es True: tupla (results, residuals).
     """
 
-    # Convertir A y b a arreglos NumPy para operaciones numéricas eficientes
-    A_np = np.array(A, dtype=float)
-    b_np = np.array(b, dtype=float)
-    n = len(b)
+    n = len(np.asarray(b).ravel())
+
+    return run_iterations(jacobi_iterations(A, b, max_iter), n, tol, max_iter,
+                          history, history_size, callback, return_residuals, trace)
+
+
+def sor_iterations(A, b, omega=1.0, max_iter=100):
+    """
+    Generador con las iteraciones del método SOR (sobrerrelajación sucesiva).
+
+    Cada iteración resuelve el sistema triangular inferior
+
+        (D + ω·L)·x^(k+1) = ω·b - (ω·U + (ω - 1)·D)·x^(k)
+
+    con A = D + L + U; con ω = 1 se obtiene Gauss-Seidel.
+
+    Parámetros:
+        A, b: Sistema Ax = b (ver jacobi_method).
+        omega (float): Parámetro de relajación, 0 < ω < 2.
+        max_iter (int): Número máximo de iteraciones.
+
+    Produce:
+        tuple: (k, x_new, step, residual), como jacobi_iterations.
+    """
+
+    A_np, b_np, D = prepare_system(A, b)
+
+    # Parte triangular inferior M = D + ω·L y parte superior N = ω·U + (ω - 1)·D
+    if sparse.issparse(A_np):
+        M = sparse.tril(A_np, k=-1, format='csr') * omega + sparse.diags(D, format='csr')
+        N = sparse.triu(A_np, k=1, format='csr') * omega
+        solve_lower = lambda rhs: spsolve_triangular(M, rhs, lower=True)
+    else:
+        M = np.tril(A_np, k=-1) * omega + np.diag(D)
+        N = np.triu(A_np, k=1) * omega
+        solve_lower = lambda rhs: solve_triangular(M, rhs, lower=True, check_finite=False)
 
     # Aproximación inicial: vector de ceros
-    x = np.zeros(n, dtype=float)
-    results = [list(x)]  # Guardar la primera aproximación
+    x = np.zeros(len(b_np), dtype=float)
 
-    # Iteraciones del método
-    for k in range(max_iter):
-        x_new = np.copy(x)
+    # Como en jacobi_iterations, cada aproximación se entrega un barrido
+    # después, cuando ya se conoce su residuo
+    for k in range(1, max_iter + 2):
+        x_new = solve_lower(omega * b_np - (N @ x + (omega - 1) * D * x))
 
-        # Cálculo de cada componente de x^(k+1)
-        for i in range(n):
-            sum_ = 0
-            for j in range(n):
-                if j != i:
-                    sum_ += A_np[i][j] * x[j]
+        # ω·(b - A·x) = M·(x_new - x): residuo sin otro producto con A completa
+        delta = x_new - x
 
-            # Fórmula del método de Jacobi
-            x_new[i] = (b_np[i] - sum_) / A_np[i][i]
+        if k > 1:
+            yield k - 1, x, step, np.linalg.norm(M @ delta, ord=np.inf) / omega
 
-        # Guardar la aproximación de esta iteración
-        results.append(list(x_new))
+        step = np.linalg.norm(delta, ord=np.inf)
+        x = x_new
 
-        # Verificar convergencia usando norma infinito
-        if np.linalg.norm(x_new - x, ord=np.inf) < tol:
-            return results
 
-        # Actualizamos x para la siguiente iteración
-        x = np.copy(x_new)
+def estimate_sor_omega(A, iterations=50):
+    """
+    Estima el parámetro de relajación óptimo de SOR:
 
-    # Si se alcanza el máximo de iteraciones sin converger
-    print("⚠ El método no convergió en el número máximo de iteraciones.")
-    return results
+        ω = 2 / (1 + sqrt(1 - ρ²))
+
+    donde ρ es el radio espectral de la matriz de iteración de Jacobi,
+    aproximado con el método de la potencia (sin formar la matriz).
+    Si ρ ≥ 1 se retorna ω = 1 (Gauss-Seidel).
+
+    Parámetros:
+        A: Matriz de coeficientes (densa o dispersa).
+        iterations (int): Iteraciones del método de la potencia.
+
+    Retorna:
+        float: Parámetro de relajación ω.
+    """
+
+    A_np, _, D = prepare_system(A, [])
+    jacobi_matrix = lambda v: (D * v - A_np @ v) / D
+
+    v = np.random.default_rng(0).random(len(D))
+    v /= np.linalg.norm(v)
+    rho = 0.0
+
+    # Se usan dos pasos por estimación porque el espectro de Jacobi suele
+    # venir en parejas ±λ y la razón de un solo paso oscila
+    for _ in range(iterations):
+        w = jacobi_matrix(jacobi_matrix(v))
+        norm = np.linalg.norm(w)
+
+        if norm == 0:
+            return 1.0
+
+        rho = np.sqrt(norm)
+        v = w / norm
+
+    if rho >= 1:
+        return 1.0
+
+    return 2 / (1 + np.sqrt(1 - rho**2))
+
+
+def conjugate_gradient_iterations(A, b, max_iter=100, preconditioner='jacobi'):
+    """
+    Generador con las iteraciones del método del Gradiente Conjugado
+    (precondicionado) para matrices simétricas definidas positivas.
+
+    Parámetros:
+        A, b: Sistema Ax = b (ver jacobi_method); A debe ser simétrica
+            definida positiva.
+        max_iter (int): Número máximo de iteraciones.
+        preconditioner (str o None): 'jacobi' para precondicionar con la
+            diagonal de A, o None para el método sin precondicionar.
+
+    Produce:
+        tuple: (k, x_new, step, residual), con residual = ‖b - A·x^(k)‖∞.
+    """
+
+    if preconditioner not in ('jacobi', None):
+        raise ValueError("preconditioner debe ser 'jacobi' o None")
+
+    A_np, b_np, D = prepare_system(A, b)
+    inv_D = 1 / D if preconditioner == 'jacobi' else np.ones_like(D)
+
+    # Aproximación inicial: vector de ceros, residuo r = b
+    x = np.zeros(len(b_np), dtype=float)
+    r = b_np.copy()
+    z = inv_D * r
+    d = z.copy()
+    rz = r @ z
+
+    for k in range(1, max_iter + 1):
+        # Residuo nulo: x ya es la solución exacta
+        if rz == 0:
+            yield k, x, 0.0, 0.0
+            return
+
+        Ad = A_np @ d
+        alpha = rz / (d @ Ad)
+
+        delta = alpha * d
+        x = x + delta
+        r = r - alpha * Ad
+
+        yield k, x, np.linalg.norm(delta, ord=np.inf), np.linalg.norm(r, ord=np.inf)
+
+        z = inv_D * r
+        rz_new = r @ z
+        d = z + (rz_new / rz) * d
+        rz = rz_new
+
+
+def gauss_seidel_method(A, b, tol=1e-4, max_iter=100, history='all', history_size=10,
+                        callback=None, return_residuals=False, trace=None):
+    """
+    Método de Gauss-Seidel para sistemas lineales Ax = b.
+
+    A diferencia de Jacobi, cada componente usa los valores ya actualizados
+    en la misma iteración; se implementa como una sustitución hacia adelante
+    con la parte triangular inferior de A. Parámetros y retorno iguales a
+    jacobi_method.
+    """
+
+    n = len(np.asarray(b).ravel())
+
+    return run_iterations(sor_iterations(A, b, 1.0, max_iter), n, tol, max_iter,
+                          history, history_size, callback, return_residuals, trace)
+
+
+def sor_method(A, b, tol=1e-4, max_iter=100, omega=None, history='all', history_size=10,
+               callback=None, return_residuals=False, trace=None):
+    """
+    Método SOR (sobrerrelajación sucesiva) para sistemas lineales Ax = b.
+
+    Parámetros:
+        omega (float): Parámetro de relajación, 0 < ω < 2. Si es None se
+            estima automáticamente con estimate_sor_omega.
+        El resto de parámetros y el retorno son iguales a jacobi_method.
+    """
+
+    if omega is None:
+        omega = estimate_sor_omega(A)
+
+    n = len(np.asarray(b).ravel())
+
+    return run_iterations(sor_iterations(A, b, omega, max_iter), n, tol, max_iter,
+                          history, history_size, callback, return_residuals, trace)
+
+
+def conjugate_gradient_method(A, b, tol=1e-4, max_iter=100, preconditioner='jacobi',
+                              history='all', history_size=10, callback=None,
+                              return_residuals=False, trace=None):
+    """
+    Método del Gradiente Conjugado (precondicionado) para sistemas Ax = b
+    con A simétrica definida positiva.
+
+    Parámetros:
+        preconditioner (str o None): 'jacobi' (diagonal de A) o None.
+        El resto de parámetros y el retorno son iguales a jacobi_method.
+    """
+
+    n = len(np.asarray(b).ravel())
+    iterations = conjugate_gradient_iterations(A, b, max_iter, preconditioner)
+
+    return run_iterations(iterations, n, tol, max_iter,
+                          history, history_size, callback, return_residuals, trace)
+
+
+def compare_linear_solvers(A, b, tol=1e-4, max_iter=100):
+    """
+    Resuelve Ax = b con Jacobi, Gauss-Seidel, SOR y Gradiente Conjugado para
+    comparar cuántas iteraciones necesita cada uno.
+
+    El Gradiente Conjugado solo se incluye si A es simétrica con diagonal
+    positiva (condición necesaria para que sea definida positiva; una A
+    simétrica indefinida daría resultados sin sentido).
+
+    El residuo de cada fila es ‖b - A·x‖∞ de la aproximación x retornada.
+
+    Retorna:
+        list: Lista de diccionarios con:
+        method, iterations, residual, x
+    """
+
+    solvers = {
+        'Jacobi': jacobi_method,
+        'Gauss-Seidel': gauss_seidel_method,
+        'SOR': sor_method,
+    }
+
+    A_check = A if sparse.issparse(A) else np.array(A, dtype=float)
+    if abs(A_check - A_check.T).max() == 0 and np.all(A_check.diagonal() > 0):
+        solvers['Gradiente Conjugado'] = conjugate_gradient_method
+
+    A_np, b_np, _ = prepare_system(A, b)
+    table = []
+
+    for name, solver in solvers.items():
+        result, residuals = solver(A, b, tol, max_iter, history='last', return_residuals=True)
+        x = np.array(result[-1])
+        table.append({
+            "method": name,
+            "iterations": len(residuals),
+            "residual": np.linalg.norm(b_np - A_np @ x, ord=np.inf),
+            "x": result[-1]
+        })
+
+    return table
+
+
+def print_solver_comparison(table):
+    print("\nComparación de métodos iterativos")
+    print("-" * 60)
+    print(f"{'Método':<25}{'Iteraciones':<15}{'Residuo':<15}")
+    print("-" * 60)
+
+    for row in table:
+        print(f"{row['method']:<25}"
+              f"{row['iterations']:<15}"
+              f"{row['residual']:<15.6e}")
+
+    if any(row['method'] == 'Gradiente Conjugado' for row in table):
+        print("Nota: el Gradiente Conjugado supone A simétrica definida positiva.")
@@ -1,6 +1,13 @@
-from sympy import symbols, lambdify, diff
+import warnings
+
+from sympy import symbols
 import matplotlib.pyplot as plt
 import numpy as np
+import scipy.sparse as sparse
+from scipy.linalg import LinAlgWarning, lu_factor, lu_solve
+from scipy.sparse.linalg import MatrixRankWarning, splu, spsolve
+
+from metodos_numericos.cache_expresiones import compile_expression, compile_residual_jacobian, compile_residuals
 
 # graficar las funciones y los puntos sistema de ecuaciones no lineales
 def graph_nonlinear_equations(f1, f2, result):
@@ -13,11 +20,11 @@ def graph_nonlinear_equations(f1, f2, result):
       result: lista de los puntos de cada iteracción
     """
 
-    x, y = symbols('x0 x1')  # Variables simbólicas
+    variables = ('x0', 'x1')  # Variables simbólicas
 
     # Convertir funciones simbólicas en funciones numéricas
-    f1_func = lambdify((x, y), f1, 'numpy')
-    f2_func = lambdify((x, y), f2, 'numpy')
+    f1_func = compile_expression(f1, variables)
+    f2_func = compile_expression(f2, variables)
 
     # Crear un grid
     x_vals = np.linspace(-10, 10, 400)
@@ -47,15 +54,37 @@ def graph_nonlinear_equations(f1, f2, result):
 
 
 # newton raphson n variables sistema de ecuaciones no lineales
-def newton_raphson_n_variables(f, x0, n, iterations):
+def _jacobian_matrix(values, rows, cols, n, use_sparse):
+    """
+    Arma la jacobiana (densa o CSR) a partir de sus elementos no nulos.
+    """
+    if use_sparse:
+        return sparse.csr_matrix((values, (rows, cols)), shape=(n, n))
+
+    jacobian = np.zeros((n, n))
+    jacobian[rows, cols] = values
+    return jacobian
+
+
+def newton_raphson_n_variables(f, x0, n, iterations, trace=None, use_sparse='auto'):
     """
     Resuelve un sistema de ecuaciones no lineales con n variables utilizando el método de Newton-Raphson.
 
+    Los residuos y la jacobiana salen de un solo kernel compilado (con
+    subexpresiones comunes eliminadas) que solo evalúa las derivadas
+    parciales no nulas. Si la jacobiana es dispersa, se arma en formato CSR
+    y cada paso se resuelve con un solver disperso.
+
     Parámetros:
       f: lista de funciones, cada una con n variables
       x0: lista con los valores iniciales para cada variable (longitud n)
       n: número de variables
       iterations: número de iteraciones
+      trace: IterationTrace opcional donde se agrega cada iteración
+        (punto, norma infinito de f en el punto de partida del paso y norma
+        infinito del paso)
+      use_sparse: True, False o 'auto' (jacobiana dispersa cuando n ≥ 50 y
+        a lo sumo el 10% de sus elementos son no nulos)
 
     Retorna:
       result: lista con los puntos (valores de las variables) en cada iteración
@@ -64,33 +93,34 @@ def newton_raphson_n_variables(f, x0, n, iterations):
     # Variables simbólicas
     variables = symbols('x0:%d' % n)
 
-    # Convertir funciones simbólicas a numéricas
-    f_funcs = [lambdify(variables, func, 'numpy') for func in f]
+    # Residuos y jacobiana en un solo kernel
+    kernel, rows, cols = compile_residual_jacobian(f, variables)
 
-    # Calcular el jacobiano
-    jacobian = []
-    for func in f:
-        jacobian_row = [diff(func, var) for var in variables]
-        jacobian.append(jacobian_row)
-
-    jacobian_func = lambdify(variables, jacobian, 'numpy')
+    if use_sparse == 'auto':
+        use_sparse = n >= 50 and len(rows) <= 0.1 * n * n
 
     # Inicializar resultados
+    x0 = np.array(x0, dtype=float)
     result = [tuple(x0)]
 
     # Método de Newton-Raphson
-    for _ in range(iterations):
-        # Evaluar jacobiano y funciones
-        jacobian_val = jacobian_func(*x0)
-        f_vals = [f_func(*x0) for f_func in f_funcs]
-
-        # Convertir a matrices NumPy
-        jacobian_matrix = np.array(jacobian_val, dtype=float)
+    for k in range(1, iterations + 1):
+        # Evaluar funciones y jacobiano
+        f_vals, jacobian_vals = kernel(x0)
         f_values = np.array(f_vals, dtype=float)
+        jacobian_matrix = _jacobian_matrix(np.array(jacobian_vals, dtype=float), rows, cols, n, use_sparse)
 
         # Resolver el sistema lineal J·Δ = f
         try:
-            delta = np.linalg.solve(jacobian_matrix, f_values)
+            if use_sparse:
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore', MatrixRankWarning)
+                    delta = spsolve(jacobian_matrix, f_values)
+
+                if not np.all(np.isfinite(delta)):
+                    raise np.linalg.LinAlgError
+            else:
+                delta = np.linalg.solve(jacobian_matrix, f_values)
         except np.linalg.LinAlgError:
             print("El jacobiano es singular o no invertible en esta iteración.")
             break
@@ -98,7 +128,150 @@ def newton_raphson_n_variables(f, x0, n, iterations):
         # Actualizar x
         x0 = x0 - delta
 
+        if trace is not None:
+            step = np.abs(delta).max()
+            trace.append(k, x0, np.abs(f_values).max(), step, step)
+
         # Guardar resultado
         result.append(tuple(x0))
 
     return result
+
+
+# Broyden (cuasi-Newton) sistema de ecuaciones no lineales
+def _finite_difference_jacobian(residual, x, f_values):
+    """
+    Jacobiana por diferencias hacia adelante (n evaluaciones de los residuos).
+    """
+    jacobian = np.empty((len(f_values), len(x)))
+
+    for j in range(len(x)):
+        h = np.sqrt(np.finfo(float).eps) * max(1.0, abs(x[j]))
+        shifted = x.copy()
+        shifted[j] += h
+        jacobian[:, j] = (residual(shifted) - f_values) / h
+
+    return jacobian
+
+
+def broyden_n_variables(f, x0, n, tol=1e-10, max_iter=100, update='good', jacobian='symbolic',
+                        trace=None):
+    """
+    Resuelve un sistema de ecuaciones no lineales con el método cuasi-Newton
+    de Broyden.
+
+    La jacobiana se evalúa y factoriza una sola vez en x0; después la
+    inversa aproximada H se corrige con actualizaciones de rango uno
+    (fórmula de Sherman-Morrison) guardadas como pares de vectores, así que
+    cada iteración solo evalúa los residuos y cuesta O(n·k) además de la
+    sustitución con la factorización inicial.
+
+    Parámetros:
+      f: lista de funciones, cada una con n variables
+      x0: lista con los valores iniciales para cada variable (longitud n)
+      n: número de variables
+      tol: el método se detiene cuando la norma infinito del paso o de los
+        residuos es menor que tol
+      max_iter: número máximo de iteraciones
+      update: 'good' (Broyden "bueno", actualiza la jacobiana) o 'bad'
+        (Broyden "malo", actualiza directamente la inversa)
+      jacobian: 'symbolic' (kernel compilado, disperso si conviene) o
+        'finite' (diferencias finitas hacia adelante)
+      trace: IterationTrace opcional donde se agrega cada iteración
+
+    Retorna:
+      result: lista con los puntos (valores de las variables) en cada
+        iteración, igual que newton_raphson_n_variables
+    """
+
+    if update not in ('good', 'bad'):
+        raise ValueError("update debe ser 'good' o 'bad'")
+
+    if jacobian not in ('symbolic', 'finite'):
+        raise ValueError("jacobian debe ser 'symbolic' o 'finite'")
+
+    variables = symbols('x0:%d' % n)
+    residual_kernel = compile_residuals(f, variables)
+    residual = lambda x: np.array(residual_kernel(x), dtype=float)
+
+    x0 = np.array(x0, dtype=float)
+    result = [tuple(x0)]
+    f_values = residual(x0)
+
+    # Jacobiana inicial, factorizada una sola vez
+    try:
+        if jacobian == 'symbolic':
+            kernel, rows, cols = compile_residual_jacobian(f, variables)
+            use_sparse = n >= 50 and len(rows) <= 0.1 * n * n
+            J0 = _jacobian_matrix(np.array(kernel(x0)[1], dtype=float), rows, cols, n, use_sparse)
+        else:
+            use_sparse = False
+            J0 = _finite_difference_jacobian(residual, x0, f_values)
+
+        if use_sparse:
+            lu = splu(J0.tocsc())
+            solve = lambda v, trans='N': lu.solve(v, trans=trans)
+        else:
+            with warnings.catch_warnings():
+                warnings.simplefilter('error', LinAlgWarning)
+                factors = lu_factor(J0)
+            solve = lambda v, trans='N': lu_solve(factors, v, trans={'N': 0, 'T': 1}[trans])
+    except (RuntimeError, LinAlgWarning, ValueError, np.linalg.LinAlgError):
+        print("El jacobiano es singular o no invertible en el punto inicial.")
+        return result
+
+    # H·v = J0⁻¹·v + Σ u_i (w_i · v)
+    u_list, w_list = [], []
+
+    def apply_H(v):
+        out = solve(v)
+        for u, w in zip(u_list, w_list):
+            out += u * (w @ v)
+        return out
+
+    def apply_H_transpose(v):
+        out = solve(v, 'T')
+        for u, w in zip(u_list, w_list):
+            out += w * (u @ v)
+        return out
+
+    for k in range(1, max_iter + 1):
+        s = -apply_H(f_values)
+        x0 = x0 + s
+        new_values = residual(x0)
+
+        step = np.abs(s).max()
+        result.append(tuple(x0))
+
+        if trace is not None:
+            trace.append(k, x0, np.abs(new_values).max(), step, step)
+
+        if not np.all(np.isfinite(new_values)):
+            print("El método diverge: los residuos dejaron de ser finitos.")
+            break
+
+        if step < tol or np.abs(new_values).max() < tol:
+            break
+
+        y = new_values - f_values
+        f_values = new_values
+        Hy = apply_H(y)
+
+        if update == 'good':
+            w = apply_H_transpose(s)
+            denominator = s @ Hy
+        else:
+            w = y
+            denominator = y @ y
+
+        if abs(denominator) < np.finfo(float).tiny:
+            print("La actualización de Broyden se anuló; el método se detiene.")
+            break
+
+        u_list.append((s - Hy) / denominator)
+        w_list.append(w)
+
+    else:
+        print("⚠ El método no convergió en el número máximo de iteraciones.")
+
+    return result
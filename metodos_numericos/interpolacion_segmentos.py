@@ -0,0 +1,130 @@
+import numpy as np
+import scipy.sparse as sparse
+
+from metodos_numericos.diferencias_finitas import solve_tridiagonal
+from metodos_numericos.lectura_matrices import load_matrix
+
+
+def load_points(path):
+    """
+    Carga un conjunto de puntos (x, y) desde un archivo de dos columnas
+    (.csv, .txt, .npy, .npz o .mtx; ver lectura_matrices.load_matrix), en
+    lugar de pedirlos uno a uno con input_points().
+
+    Retorna:
+        ndarray: Arreglo (n, 2) con los puntos.
+    """
+    points = load_matrix(path)
+
+    if sparse.issparse(points):
+        points = points.toarray()
+
+    if points.ndim != 2 or points.shape[1] != 2:
+        raise ValueError("El archivo debe tener dos columnas: x, y")
+
+    return points
+
+
+class PiecewiseInterpolator:
+    """
+    Interpolación por segmentos para conjuntos grandes de puntos.
+
+    Tipos:
+        - 'linear'   → rectas entre puntos consecutivos
+        - 'cubic'    → spline cúbico natural (segunda derivada nula en los
+                       extremos); las segundas derivadas salen de un sistema
+                       tridiagonal resuelto en O(n)
+        - 'lagrange' → polinomio de Lagrange local de grado order con los
+                       order + 1 nodos más cercanos a cada punto
+
+    La construcción es O(n) y el intervalo de cada punto de consulta se
+    busca con búsqueda binaria (np.searchsorted) sobre los nodos ordenados,
+    vectorizada para arreglos de puntos.
+
+    Parámetros:
+        points: lista de tuplas [(x0,y0), ..., (xn,yn)] o arreglo (n, 2)
+        kind (str): 'linear', 'cubic' o 'lagrange'
+        order (int): grado de los polinomios locales del tipo 'lagrange'
+    """
+
+    def __init__(self, points, kind='cubic', order=3):
+        if kind not in ('linear', 'cubic', 'lagrange'):
+            raise ValueError("kind debe ser 'linear', 'cubic' o 'lagrange'")
+
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        order_x = np.argsort(points[:, 0], kind='stable')
+        self.x = points[order_x, 0]
+        self.y = points[order_x, 1]
+        self.kind = kind
+        self.order = min(order, len(self.x) - 1)
+
+        if len(self.x) < 2:
+            raise ValueError("Se necesitan al menos dos puntos")
+
+        if np.any(np.diff(self.x) == 0):
+            raise ValueError("Los nodos x deben ser distintos")
+
+        self.h = np.diff(self.x)
+
+        if kind == 'cubic':
+            self.second_derivatives = self._natural_spline()
+
+    def _natural_spline(self):
+        """
+        Segundas derivadas M_i del spline natural:
+
+            h_{i-1}·M_{i-1} + 2·(h_{i-1} + h_i)·M_i + h_i·M_{i+1}
+                = 6·((y_{i+1} - y_i) / h_i - (y_i - y_{i-1}) / h_{i-1})
+        """
+        h = self.h
+        M = np.zeros(len(self.x))
+
+        if len(self.x) > 2:
+            slopes = np.diff(self.y) / h
+            rhs = 6 * np.diff(slopes)
+            M[1:-1] = solve_tridiagonal(h[1:-1], 2 * (h[:-1] + h[1:]), h[1:-1], rhs)
+
+        return M
+
+    def _locate(self, x):
+        """Índice i del intervalo [x_i, x_{i+1}] de cada punto (extremos incluidos)."""
+        return np.clip(np.searchsorted(self.x, x, side='right') - 1, 0, len(self.x) - 2)
+
+    def __call__(self, x):
+        """
+        Evalúa la interpolación en un punto o arreglo de puntos. Fuera del
+        rango de los nodos se extrapola con el primer o último segmento.
+        """
+        x = np.asarray(x, dtype=float)
+        i = self._locate(x)
+
+        if self.kind == 'linear':
+            t = (x - self.x[i]) / self.h[i]
+            result = self.y[i] + t * (self.y[i + 1] - self.y[i])
+
+        elif self.kind == 'cubic':
+            h = self.h[i]
+            M = self.second_derivatives
+            a = self.x[i + 1] - x
+            b = x - self.x[i]
+            result = (M[i] * a**3 + M[i + 1] * b**3) / (6 * h) \
+                + (self.y[i] / h - M[i] * h / 6) * a \
+                + (self.y[i + 1] / h - M[i + 1] * h / 6) * b
+
+        else:
+            # Ventana de order + 1 nodos centrada en el intervalo de cada punto
+            k = self.order
+            start = np.clip(i - (k - 1) // 2, 0, len(self.x) - k - 1)
+            window = start[..., np.newaxis] + np.arange(k + 1)
+            xw = self.x[window]
+            yw = self.y[window]
+
+            result = np.zeros(x.shape)
+            for j in range(k + 1):
+                basis = np.ones(x.shape)
+                for m in range(k + 1):
+                    if m != j:
+                        basis *= (x - xw[..., m]) / (xw[..., j] - xw[..., m])
+                result += yw[..., j] * basis
+
+        return result if result.ndim else float(result)
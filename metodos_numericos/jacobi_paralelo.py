@@ -0,0 +1,172 @@
+import os
+from contextlib import closing
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import scipy.sparse as sparse
+
+from metodos_numericos.ecuaciones_lineales import prepare_system, run_iterations
+
+
+# Estado de cada proceso trabajador: vistas NumPy sobre la memoria compartida
+_worker = {}
+
+
+def _share_array(array):
+    """
+    Copia un arreglo NumPy a un bloque de memoria compartida.
+
+    Retorna:
+        tuple: (shm, spec), donde spec = (nombre, forma, dtype) permite a
+        otros procesos crear una vista del arreglo sin copiarlo.
+    """
+    shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+    view[...] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+def _init_worker(specs):
+    """
+    Inicializador de cada proceso: se conecta a los bloques compartidos.
+    """
+    _worker['shm'] = []
+    _worker['blocks'] = {}
+
+    for key, (name, shape, dtype) in specs.items():
+        shm = SharedMemory(name=name)
+        _worker['shm'].append(shm)
+        _worker[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _sweep_block(task):
+    """
+    Calcula las filas [start, stop) de x^(k+1) para una iteración de Jacobi.
+
+    Lee x^(k) de la mitad 'source' del búfer compartido xs y escribe en la
+    otra, así que no hay copias entre iteraciones.
+
+    Retorna:
+        tuple: (step, residual) locales en norma infinito; el residuo es el
+        de x^(k).
+    """
+    start, stop, source = task
+
+    # Bloque de filas de A en CSR (vistas sobre la memoria compartida)
+    block = _worker['blocks'].get((start, stop))
+    if block is None:
+        indptr = _worker['indptr']
+        lo, hi = indptr[start], indptr[stop]
+        block = sparse.csr_matrix(
+            (_worker['data'][lo:hi], _worker['indices'][lo:hi], indptr[start:stop + 1] - lo),
+            shape=(stop - start, len(_worker['b']))
+        )
+        _worker['blocks'][(start, stop)] = block
+
+    x = _worker['xs'][source]
+    x_new = _worker['xs'][1 - source]
+    D = _worker['D'][start:stop]
+    x_block = x[start:stop]
+
+    x_new[start:stop] = (_worker['b'][start:stop] - (block @ x - D * x_block)) / D
+
+    delta = x_new[start:stop] - x_block
+    if len(delta) == 0:
+        return 0.0, 0.0
+
+    return np.abs(delta).max(), np.abs(D * delta).max()
+
+
+def parallel_jacobi_iterations(A, b, max_iter=100, workers=None):
+    """
+    Generador con las iteraciones del método de Jacobi por bloques de filas
+    repartidos entre varios procesos.
+
+    A (en CSR), b, la diagonal y los vectores x^(k), x^(k+1) viven en
+    memoria compartida, de modo que en cada iteración solo viajan entre
+    procesos los límites de cada bloque y dos números por bloque para el
+    criterio de convergencia.
+
+    Parámetros:
+        A, b: Sistema Ax = b (ver jacobi_method).
+        max_iter (int): Número máximo de iteraciones.
+        workers (int): Número de procesos (por defecto, los núcleos disponibles).
+
+    Produce:
+        tuple: (k, x_new, step, residual), como jacobi_iterations.
+    """
+
+    A_np, b_np, D = prepare_system(A, b)
+    A_csr = sparse.csr_matrix(A_np)
+    n = len(b_np)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # Bloques de filas con aproximadamente el mismo número de elementos no nulos
+    bounds = np.searchsorted(A_csr.indptr, np.linspace(0, A_csr.nnz, workers + 1))
+    bounds[0], bounds[-1] = 0, n
+    blocks = [(int(lo), int(hi)) for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+
+    arrays = {
+        'data': A_csr.data,
+        'indices': A_csr.indices,
+        'indptr': A_csr.indptr,
+        'b': b_np,
+        'D': D,
+        'xs': np.zeros((2, n)),
+    }
+
+    shared = {}
+    specs = {}
+
+    try:
+        for key, array in arrays.items():
+            shared[key], specs[key] = _share_array(array)
+
+        xs = np.ndarray((2, n), dtype=float, buffer=shared['xs'].buf)
+
+        with Pool(len(blocks), initializer=_init_worker, initargs=(specs,)) as pool:
+            source = 0
+
+            # Como en jacobi_iterations, el residuo de x^(k) se obtiene en el
+            # barrido que calcula x^(k+1), así que se hace uno más que max_iter
+            for k in range(1, max_iter + 2):
+                # Un barrido en paralelo y una sincronización por iteración
+                partial = pool.map(_sweep_block, [(lo, hi, source) for lo, hi in blocks])
+
+                # x^(k-1) sigue intacto en la mitad 'source' (el barrido
+                # escribe en la otra); se entrega una copia porque el búfer
+                # se reutiliza en la siguiente iteración
+                if k > 1:
+                    yield k - 1, xs[source].copy(), step, max(p[1] for p in partial)
+
+                step = max(p[0] for p in partial)
+                source = 1 - source
+    finally:
+        for shm in shared.values():
+            shm.close()
+            shm.unlink()
+
+
+def parallel_jacobi_method(A, b, tol=1e-4, max_iter=100, workers=None, history='last',
+                           history_size=10, callback=None, return_residuals=False, trace=None):
+    """
+    Método de Jacobi por bloques en varios núcleos para sistemas Ax = b
+    muy grandes (pensado para matrices dispersas con millones de elementos
+    no nulos).
+
+    Parámetros:
+        workers (int): Número de procesos (por defecto, los núcleos disponibles).
+        history (str): Política de historial; por defecto 'last', ya que en
+            sistemas grandes guardar todas las aproximaciones ocupa demasiada
+            memoria.
+        El resto de parámetros y el retorno son iguales a jacobi_method.
+    """
+
+    n = len(np.asarray(b).ravel())
+
+    with closing(parallel_jacobi_iterations(A, b, max_iter, workers)) as iterations:
+        return run_iterations(iterations, n, tol, max_iter,
+                              history, history_size, callback, return_residuals, trace)
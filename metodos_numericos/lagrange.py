@@ -1,4 +1,5 @@
 # metodos_numericos/lagrange.py
+import numpy as np
 import sympy as sp
 
 def lagrange_interpolation(points):
@@ -30,6 +31,110 @@ def lagrange_interpolation(points):
     return sp.simplify(P)
 
 
+class BarycentricInterpolator:
+    """
+    Interpolación de Lagrange numérica en forma baricéntrica.
+
+    Los pesos w_j = 1 / Π_{k≠j} (x_j - x_k) se calculan una vez en O(n²);
+    luego cada evaluación cuesta O(n):
+
+        p(x) = Σ w_j·y_j / (x - x_j)  /  Σ w_j / (x - x_j)
+
+    Los pesos se guardan como logaritmo de su valor absoluto más su signo,
+    porque para miles de nodos los productos se desbordan; como la fórmula
+    solo depende de los pesos salvo un factor común, se normalizan al usarlos.
+
+    Parámetros:
+      points: lista de tuplas [(x0,y0), (x1,y1), ..., (xn,yn)]
+    """
+
+    def __init__(self, points):
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        self.x = points[:, 0].copy()
+        self.y = points[:, 1].copy()
+
+        if len(np.unique(self.x)) != len(self.x):
+            raise ValueError("Los nodos x deben ser distintos")
+
+        n = len(self.x)
+        self._log_weights = np.zeros(n)
+        self._signs = np.ones(n)
+
+        # Una fila de diferencias a la vez: memoria O(n)
+        for j in range(n):
+            diff = np.delete(self.x[j] - self.x, j)
+            self._log_weights[j] = -np.log(np.abs(diff)).sum()
+            self._signs[j] = np.prod(np.sign(diff))
+
+    @property
+    def weights(self):
+        """Pesos baricéntricos normalizados (el mayor en valor absoluto es 1)."""
+        return self._signs * np.exp(self._log_weights - self._log_weights.max())
+
+    def add_node(self, x_new, y_new):
+        """
+        Agrega el punto (x_new, y_new) actualizando los pesos en O(n),
+        sin recalcularlos desde cero.
+        """
+        diff = self.x - x_new
+
+        if np.any(diff == 0):
+            raise ValueError("Los nodos x deben ser distintos")
+
+        # w_j ← w_j / (x_j - x_new) y el nuevo peso 1 / Π (x_new - x_j)
+        self._log_weights = np.append(self._log_weights - np.log(np.abs(diff)),
+                                      -np.log(np.abs(diff)).sum())
+        self._signs = np.append(self._signs * np.sign(diff), np.prod(np.sign(-diff)))
+
+        self.x = np.append(self.x, x_new)
+        self.y = np.append(self.y, y_new)
+
+    def __call__(self, x, chunk_size=None):
+        """
+        Evalúa el polinomio interpolante en un punto o arreglo de puntos.
+
+        Los puntos se procesan por bloques de chunk_size para que la matriz
+        de diferencias (bloque x n) no ocupe demasiada memoria.
+        """
+        x = np.asarray(x, dtype=float)
+        flat = x.ravel()
+        result = np.empty(len(flat))
+        weights = self.weights
+        weighted_y = weights * self.y
+
+        # Nodos ordenados para detectar en O(log n) los puntos que coinciden con un nodo
+        order = np.argsort(self.x)
+        sorted_x = self.x[order]
+
+        if chunk_size is None:
+            chunk_size = max(1, 4_000_000 // len(self.x))
+
+        for start in range(0, len(flat), chunk_size):
+            block = flat[start:start + chunk_size]
+
+            # 1 / (x - x_j) una sola vez; numerador y denominador son dos productos matriz-vector
+            with np.errstate(divide='ignore', invalid='ignore'):
+                inverse = 1.0 / (block[:, np.newaxis] - self.x[np.newaxis, :])
+                values = (inverse @ weighted_y) / (inverse @ weights)
+
+            # Los puntos que coinciden con un nodo toman el valor del nodo
+            position = np.minimum(np.searchsorted(sorted_x, block), len(sorted_x) - 1)
+            hits = sorted_x[position] == block
+            values[hits] = self.y[order[position[hits]]]
+
+            result[start:start + chunk_size] = values
+
+        result = result.reshape(x.shape)
+        return result if result.ndim else float(result)
+
+    def to_sympy(self):
+        """
+        Retorna el polinomio interpolante simbólico (ver lagrange_interpolation).
+        Solo es práctico para pocos nodos.
+        """
+        return lagrange_interpolation(list(zip(self.x, self.y)))
+
+
 def input_points():
     """
     Pide al usuario el grado y los puntos
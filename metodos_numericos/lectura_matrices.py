@@ -0,0 +1,92 @@
+import ast
+import os
+
+import numpy as np
+import scipy.io
+import scipy.sparse as sparse
+
+
+def load_matrix(path, key=None):
+    """
+    Carga una matriz desde un archivo, sin pasar por SymPy.
+
+    Formatos según la extensión:
+        - .npy        → arreglo NumPy en memoria mapeada (no se lee completo)
+        - .npz        → matriz dispersa guardada con scipy.sparse.save_npz, o
+                        el arreglo 'key' (por defecto el primero) del archivo;
+                        los .npz no admiten mapeo en memoria, pero cada
+                        arreglo se lee solo cuando se pide
+        - .mtx        → Matrix Market; las matrices dispersas quedan en CSR
+        - .csv / .txt → texto con valores separados por comas
+
+    Parámetros:
+        path (str): Ruta del archivo.
+        key (str): Nombre del arreglo dentro de un .npz (opcional).
+
+    Retorna:
+        ndarray o matriz dispersa CSR de tipo float.
+    """
+
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == '.npy':
+        matrix = np.load(path, mmap_mode='r')
+
+    elif extension == '.npz':
+        with np.load(path) as archive:
+            if 'format' in archive.files and 'shape' in archive.files:
+                return sparse.load_npz(path).tocsr().astype(float, copy=False)
+
+            matrix = archive[key if key is not None else archive.files[0]]
+
+    elif extension == '.mtx':
+        matrix = scipy.io.mmread(path)
+
+        if sparse.issparse(matrix):
+            return matrix.tocsr().astype(float, copy=False)
+
+    elif extension in ('.csv', '.txt'):
+        matrix = np.loadtxt(path, delimiter=',', ndmin=2)
+
+    else:
+        raise ValueError(f"Formato de archivo no soportado: {extension}")
+
+    # Sin copia si el arreglo ya es float (se conserva el mapeo en memoria)
+    return np.asarray(matrix, dtype=float)
+
+
+def load_vector(path, key=None):
+    """
+    Carga un vector desde un archivo (mismos formatos que load_matrix).
+
+    Retorna:
+        ndarray: Vector unidimensional de tipo float.
+    """
+    vector = load_matrix(path, key)
+
+    if sparse.issparse(vector):
+        vector = vector.toarray()
+
+    return vector.ravel()
+
+
+def parse_matrix(text):
+    """
+    Interpreta la entrada del usuario para una matriz o un vector.
+
+    Si el texto es la ruta de un archivo existente se carga con load_matrix;
+    si no, se interpreta como un literal de Python, p. ej. [[4, 1], [2, 5]],
+    con ast.literal_eval (no ejecuta código, a diferencia de eval).
+
+    Retorna:
+        ndarray o matriz dispersa CSR de tipo float.
+    """
+    text = text.strip()
+
+    if os.path.isfile(text):
+        return load_matrix(text)
+
+    try:
+        return np.array(ast.literal_eval(text), dtype=float)
+    except (ValueError, SyntaxError):
+        raise ValueError(f"Entrada de matriz no válida: {text}")
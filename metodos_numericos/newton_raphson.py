@@ -1,4 +1,5 @@
-from sympy import symbols, lambdify, diff
+from metodos_numericos.cache_expresiones import compile_expression, compile_value_and_derivative
+import math
 import matplotlib.pyplot as plt
 import numpy as np
 
@@ -12,11 +13,8 @@ def graph_newton_raphson(f, result, x_range=None):
       result (list): valores de x en cada iteración
       x_range (tuple): rango opcional (xmin, xmax)
     """
-    # Variable simbólica
-    x = symbols('x')
-
-    # Convertir f(x) simbólica → función de Python
-    f_py = lambdify(x, f)
+    # Convertir f(x) simbólica → función de Python (compilada una sola vez)
+    f_py = compile_expression(f, 'x')
 
     # Determinar rango automáticamente si no se da
     if x_range is None:
@@ -49,35 +47,216 @@ def graph_newton_raphson(f, result, x_range=None):
 
 
 #     MÉTODO DE NEWTON - RAPHSON
-def newton_raphson(f, x0, tol=1e-10):
+def newton_raphson(f, x0, tol=1e-10, max_iter=100, min_derivative=1e-14, max_step=None,
+                   divergence_limit=10, trace=None):
     """
     Calcula la raíz de una función usando el método Newton-Raphson.
 
+    Cada iteración hace una sola evaluación de f y f' juntas (kernel
+    compilado con eliminación de subexpresiones comunes). El método se
+    detiene si |f(x)| o el paso caen por debajo de tol, y nunca pasa de
+    max_iter iteraciones.
+
     Parámetros:
       f (sympy expression): función simbólica
       x0 (float): valor inicial
       tol (float): tolerancia del error
+      max_iter (int): máximo de iteraciones
+      min_derivative (float): |f'(x)| por debajo de este valor se considera nula
+      max_step (float): tamaño máximo de cada paso (None para no limitarlo);
+        los pasos más largos se recortan a este tamaño
+      divergence_limit (int): número de iteraciones seguidas en que |f(x)|
+        crece antes de considerar que el método diverge
+      trace (IterationTrace): traza opcional donde se agrega cada iteración
+        (x, f(x), paso y |paso|)
 
     Retorna:
       list: valores de x en cada iteración
-    """
 
-    x = symbols('x')
+    Lanza:
+      ValueError: si la derivada se anula, aparecen valores no finitos o el
+        método diverge
+    """
 
-    # Derivada simbólica
-    f_prime = diff(f, x)
+    # f y su derivada en un solo kernel de Python
+    kernel = compile_value_and_derivative(f, 'x', 'math')
 
-    # Convertir f y f' a funciones Python
-    f_py = lambdify(x, f)
-    f_prime_py = lambdify(x, f_prime)
+    def f_and_prime(x):
+        try:
+            value, derivative = kernel(x)
+            return float(value), float(derivative)
+        except (TypeError, ValueError, OverflowError, ZeroDivisionError):
+            raise ValueError(f"La función no tiene un valor real en x = {x}")
 
     # Comenzar iterando
-    x_current = x0
+    x_current = float(x0)
     result = [x_current]
+    f_value, f_prime_value = f_and_prime(x_current)
+    growth = 0
+
+    if trace is not None:
+        trace.append(0, x_current, f_value)
 
     # Bucle iterativo
-    while abs(f_py(x_current)) > tol:
-        x_current = x_current - f_py(x_current) / f_prime_py(x_current)
+    for k in range(1, max_iter + 1):
+        if abs(f_value) <= tol:
+            return result
+
+        if not math.isfinite(f_value) or not math.isfinite(f_prime_value):
+            raise ValueError(f"Valores no finitos en x = {x_current}")
+
+        if abs(f_prime_value) < min_derivative:
+            raise ValueError(f"La derivada es prácticamente nula en x = {x_current}")
+
+        step = f_value / f_prime_value
+
+        if max_step is not None and abs(step) > max_step:
+            step = math.copysign(max_step, step)
+
+        x_current = x_current - step
         result.append(x_current)
 
-    return result
\ No newline at end of file
+        previous = abs(f_value)
+        f_value, f_prime_value = f_and_prime(x_current)
+
+        if trace is not None:
+            trace.append(k, x_current, f_value, -step, abs(step))
+
+        # Paso despreciable: x ya no cambia
+        if abs(step) <= tol:
+            return result
+
+        growth = growth + 1 if abs(f_value) > previous else 0
+
+        if growth >= divergence_limit:
+            raise ValueError(f"El método diverge: |f(x)| creció en {growth} iteraciones seguidas")
+
+    if abs(f_value) > tol:
+        print(f"⚠ El método no convergió en {max_iter} iteraciones.")
+
+    return result
+
+
+
+#     NEWTON - RAPHSON CON MÚLTIPLES PUNTOS INICIALES
+def newton_raphson_multistart(f, x_range, n_starts=200, tol=1e-10, max_iter=100, root_tol=1e-8):
+    """
+    Busca todas las raíces de f en un intervalo iterando Newton-Raphson
+    desde n_starts puntos iniciales a la vez, como un arreglo de NumPy.
+
+    Cada iteración evalúa f y f' solo en los puntos que siguen activos; los
+    que convergen o divergen (derivada nula o valores no finitos) se
+    retiran. Un punto converge cuando f se anula o cuando su error estimado
+    es menor que tol. El error se estima con los dos últimos pasos como
+    |paso| / (1 - q), con q el cociente entre ellos. Así las raíces
+    múltiples, donde Newton converge solo linealmente, no se dan por
+    resueltas antes de tiempo. Los puntos que agotan max_iter con |f| ≤ tol
+    se aceptan con su error estimado. Dos raíces vecinas se agrupan en una
+    sola si difieren en menos de root_tol o de la suma de sus errores
+    estimados.
+
+    Parámetros:
+      f (sympy expression): función simbólica
+      x_range (tuple): intervalo (xmin, xmax) donde se siembran los puntos
+      n_starts (int): número de puntos iniciales
+      tol (float): tolerancia del error
+      max_iter (int): máximo de iteraciones
+      root_tol (float): distancia bajo la cual dos raíces se consideran iguales
+
+    Retorna:
+      tuple: (roots, starts, labels)
+        roots  → raíces distintas dentro de x_range, ordenadas
+        starts → puntos iniciales
+        labels → índice en roots de la raíz a la que llegó cada punto
+                 inicial (su cuenca), o -1 si no convergió o salió del rango
+    """
+    f_and_prime = compile_value_and_derivative(f, 'x')
+
+    x_min, x_max = x_range
+    starts = np.linspace(x_min, x_max, n_starts)
+    x = starts.copy()
+
+    active = np.ones(n_starts, dtype=bool)
+    converged = np.zeros(n_starts, dtype=bool)
+    f_last = np.full(n_starts, np.inf)
+    previous_step = np.full(n_starts, np.inf)
+    error = np.full(n_starts, np.inf)
+
+    for _ in range(max_iter):
+        index = np.flatnonzero(active)
+
+        if len(index) == 0:
+            break
+
+        x_active = x[index]
+        f_values, f_prime_values = np.broadcast_arrays(*f_and_prime(x_active))
+
+        with np.errstate(all='ignore'):
+            step = f_values / f_prime_values
+            # estimación del error para convergencia lineal (raíces múltiples);
+            # con convergencia cuadrática q → 0 y queda |paso|
+            q = np.minimum(np.abs(step) / previous_step[index], 0.99)
+            estimate = np.abs(step) / (1 - q)
+
+        x_new = x_active - step
+        diverged = ~np.isfinite(x_new)
+        done = ~diverged & ((f_values == 0) | (estimate <= tol))
+
+        x[index[~diverged]] = x_new[~diverged]
+        f_last[index] = f_values
+        previous_step[index] = np.abs(step)
+        # si f se anula (p. ej. dentro de la banda de redondeo de una raíz
+        # múltiple) se conserva el error estimado con el paso anterior
+        kept = np.where(np.isfinite(error[index]), error[index], 0.0)
+        error[index] = np.where(f_values != 0, estimate, kept)
+        converged[index[done]] = True
+        active[index[done | diverged]] = False
+
+    # Los que agotaron max_iter con |f| ≤ tol se aceptan con su error estimado
+    converged |= active & (np.abs(f_last) <= tol) & np.isfinite(error)
+
+    # Agrupar las raíces convergidas dentro del intervalo
+    labels = np.full(n_starts, -1)
+    candidates = np.flatnonzero(converged & (x >= x_min) & (x <= x_max))
+
+    if len(candidates) == 0:
+        return np.array([]), starts, labels
+
+    order = candidates[np.argsort(x[candidates])]
+    separation = np.maximum(root_tol, error[order][:-1] + error[order][1:])
+    groups = np.concatenate(([0], np.cumsum(np.diff(x[order]) > separation)))
+    roots = np.bincount(groups, weights=x[order]) / np.bincount(groups)
+    labels[order] = groups
+
+    return roots, starts, labels
+
+
+
+#     GRAFICAR LAS CUENCAS DE ATRACCIÓN
+def graph_newton_basins(f, roots, starts, labels):
+    """
+    Grafica f(x), sus raíces y los puntos iniciales coloreados según la raíz
+    a la que convergieron (resultado de newton_raphson_multistart).
+    """
+    f_py = compile_expression(f, 'x')
+
+    x_values = np.linspace(starts.min(), starts.max(), 500)
+    y_values = np.broadcast_to(f_py(x_values), x_values.shape)
+
+    plt.figure()
+    plt.title("Cuencas de atracción - Método de Newton-Raphson")
+    plt.xlabel("x")
+    plt.ylabel("f(x)")
+
+    plt.plot(x_values, y_values, label="f(x)")
+    plt.axhline(0, color='gray', linewidth=0.8)
+
+    plt.scatter(starts[labels < 0], np.zeros(np.sum(labels < 0)), marker='|', color='lightgray',
+                label="Sin convergencia")
+    plt.scatter(starts[labels >= 0], np.zeros(np.sum(labels >= 0)), c=labels[labels >= 0],
+                cmap='tab10', marker='|', s=200)
+    plt.plot(roots, np.zeros(len(roots)), 'ro', label="Raíces")
+
+    plt.legend()
+    plt.grid(True)
+    plt.show()
@@ -0,0 +1,114 @@
+import numpy as np
+import sympy as sp
+
+from metodos_numericos.cache_expresiones import parse_expression
+
+
+def horner(coefficients, x, center=0.0):
+    """
+    Evalúa Σ c_k·(x - center)^k con el esquema de Horner.
+
+    Cada paso opera sobre todo el arreglo x a la vez, de modo que el costo
+    es O(grado) operaciones vectorizadas.
+
+    Parámetros:
+        coefficients (array): Coeficientes [c_0, c_1, ..., c_n].
+        x (float o array): Punto(s) de evaluación.
+        center (float): Centro de la expansión.
+
+    Retorna:
+        float o ndarray: Valor del polinomio en x.
+    """
+    t = np.asarray(x, dtype=float) - center
+    result = np.full(t.shape, coefficients[-1], dtype=float)
+
+    for c in coefficients[-2::-1]:
+        result *= t
+        result += c
+
+    return result if result.ndim else float(result)
+
+
+class Polynomial:
+    """
+    Polinomio numérico p(x) = Σ c_k·(x - center)^k guardado como arreglo de
+    coeficientes, para evaluar resultados de Taylor o Lagrange sin SymPy.
+
+    Parámetros:
+        coefficients (array): Coeficientes [c_0, c_1, ..., c_n] en potencias
+            crecientes de (x - center).
+        center (float): Centro de la expansión (x0 en Taylor).
+    """
+
+    def __init__(self, coefficients, center=0.0):
+        self.coefficients = np.atleast_1d(np.asarray(coefficients, dtype=float))
+        self.center = float(center)
+
+    @classmethod
+    def from_sympy(cls, expr, center=0.0):
+        """
+        Convierte un polinomio simbólico en x (p. ej. el resultado de taylor o
+        de lagrange_interpolation) expandiéndolo alrededor de center.
+        """
+        x = sp.symbols('x')
+        expr = parse_expression(expr)
+        shifted = sp.expand(expr.subs(x, x + center))
+        coefficients = sp.Poly(shifted, x).all_coeffs()[::-1]
+
+        return cls([float(c) for c in coefficients], center)
+
+    @property
+    def degree(self):
+        return len(self.coefficients) - 1
+
+    def __call__(self, x):
+        return horner(self.coefficients, x, self.center)
+
+    def derivative(self, m=1):
+        """
+        Retorna la derivada de orden m como un nuevo Polynomial.
+        """
+        c = self.coefficients
+
+        for _ in range(m):
+            if len(c) == 1:
+                return Polynomial([0.0], self.center)
+            c = c[1:] * np.arange(1, len(c))
+
+        return Polynomial(c, self.center)
+
+    def integral(self, constant=0.0):
+        """
+        Retorna la antiderivada que vale constant en x = center.
+        """
+        c = self.coefficients / np.arange(1, len(self.coefficients) + 1)
+
+        return Polynomial(np.concatenate(([constant], c)), self.center)
+
+    def to_sympy(self):
+        """
+        Retorna el polinomio como expresión de SymPy en potencias de (x - center).
+        """
+        x = sp.symbols('x')
+
+        return sum(sp.Float(c) * (x - self.center)**k for k, c in enumerate(self.coefficients))
+
+    def __repr__(self):
+        return f"Polynomial(degree={self.degree}, center={self.center})"
+
+
+def as_polynomial(t, center=None):
+    """
+    Acepta un Polynomial o un polinomio simbólico y retorna un Polynomial.
+
+    Un polinomio simbólico se expande alrededor de center (x0 en Taylor);
+    expandirlo alrededor de otro punto pierde precisión, así que center es
+    obligatorio en ese caso.
+    """
+    if isinstance(t, Polynomial):
+        return t
+
+    if center is None:
+        raise ValueError("Se necesita el centro para convertir un polinomio simbólico")
+
+    return Polynomial.from_sympy(t, center)
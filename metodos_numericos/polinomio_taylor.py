@@ -1,79 +1,404 @@
-from sympy import symbols, lambdify, diff
+from sympy import symbols, Add, Mul, Pow, Float
+import sympy as sp
 import matplotlib.pyplot as plt
 import numpy as np
 import math
 
+from metodos_numericos.cache_expresiones import compile_expression, get_derivative, parse_expression
+from metodos_numericos.polinomio import Polynomial, as_polynomial
+
+
+# ============================================================
+#   SERIES DE TAYLOR TRUNCADAS (DIFERENCIACIÓN AUTOMÁTICA)
+# ============================================================
+
+def _series_mul(a, b):
+    """Producto de dos series truncadas (producto de Cauchy)."""
+    return np.convolve(a, b)[:len(a)]
+
+
+def _series_div(u, v):
+    """Cociente de series: q_k = (u_k - Σ_{j=1..k} v_j·q_{k-j}) / v_0."""
+    if v[0] == 0:
+        raise ValueError("La función no es analítica en x0 (división por cero)")
+
+    q = np.zeros(len(u))
+    for k in range(len(u)):
+        q[k] = (u[k] - np.dot(v[1:k + 1], q[k - 1::-1][:k])) / v[0]
+    return q
+
+
+def _series_compose(a, g0, d):
+    """
+    Serie de g(a) a partir de g(a_0) y de la serie d de g'(a), usando
+    g(a)' = g'(a)·a':  g_k = (1/k)·Σ_{j=1..k} j·a_j·d_{k-j}.
+    """
+    g = np.zeros(len(a))
+    g[0] = g0
+    ja = np.arange(len(a)) * a
+    for k in range(1, len(a)):
+        g[k] = np.dot(ja[1:k + 1], d[k - 1::-1][:k]) / k
+    return g
+
+
+def _series_exp(a):
+    """exp(a): la derivada es la propia serie, que se construye término a término."""
+    e = np.zeros(len(a))
+    e[0] = math.exp(a[0])
+    ja = np.arange(len(a)) * a
+    for k in range(1, len(a)):
+        e[k] = np.dot(ja[1:k + 1], e[k - 1::-1][:k]) / k
+    return e
+
+
+def _series_sin_cos(a, hyperbolic=False):
+    """sin(a) y cos(a) (o sinh y cosh), cada una derivada de la otra."""
+    s = np.zeros(len(a))
+    c = np.zeros(len(a))
+    s[0], c[0] = (math.sinh(a[0]), math.cosh(a[0])) if hyperbolic else (math.sin(a[0]), math.cos(a[0]))
+    sign = 1 if hyperbolic else -1
+    ja = np.arange(len(a)) * a
+    for k in range(1, len(a)):
+        s[k] = np.dot(ja[1:k + 1], c[k - 1::-1][:k]) / k
+        c[k] = sign * np.dot(ja[1:k + 1], s[k - 1::-1][:k]) / k
+    return s, c
+
+
+def _series_pow(a, p):
+    """
+    a^p con exponente constante: potencia entera por multiplicaciones
+    repetidas, o la recurrencia b_k = Σ_{j=1..k} ((p + 1)·j - k)·a_j·b_{k-j} / (k·a_0).
+    """
+    if float(p).is_integer() and p >= 0:
+        result = np.zeros(len(a))
+        result[0] = 1.0
+        base = a
+        p = int(p)
+        while p:
+            if p & 1:
+                result = _series_mul(result, base)
+            base = _series_mul(base, base)
+            p >>= 1
+        return result
+
+    if a[0] == 0:
+        raise ValueError("La función no es analítica en x0 (potencia no entera de 0)")
+
+    b = np.zeros(len(a))
+    b[0] = a[0]**p
+    for k in range(1, len(a)):
+        j = np.arange(1, k + 1)
+        b[k] = np.dot(((p + 1) * j - k) * a[1:k + 1], b[k - 1::-1][:k]) / (k * a[0])
+    return b
+
+
+def _taylor_series(expr, x, x0, n, memo):
+    """
+    Evalúa la serie de Taylor truncada (coeficientes f^(k)(x0)/k!) de una
+    expresión recorriendo su árbol de SymPy; memo evita repetir las
+    subexpresiones comunes.
+
+    Lanza NotImplementedError si la expresión usa una función sin regla.
+    """
+    if expr in memo:
+        return memo[expr]
+
+    one = np.zeros(n + 1)
+    one[0] = 1.0
+
+    if expr == x:
+        result = np.zeros(n + 1)
+        result[0] = x0
+        if n >= 1:
+            result[1] = 1.0
+
+    elif not expr.has(x):
+        result = float(expr) * one
+
+    elif isinstance(expr, Add):
+        result = sum(_taylor_series(arg, x, x0, n, memo) for arg in expr.args)
+
+    elif isinstance(expr, Mul):
+        result = one
+        for arg in expr.args:
+            result = _series_mul(result, _taylor_series(arg, x, x0, n, memo))
+
+    elif isinstance(expr, Pow):
+        base, exponent = expr.args
+
+        if exponent.has(x):
+            # a^b = exp(b·log(a))
+            result = _taylor_series(sp.exp(exponent * sp.log(base)), x, x0, n, memo)
+        elif exponent == -1:
+            result = _series_div(one, _taylor_series(base, x, x0, n, memo))
+        else:
+            result = _series_pow(_taylor_series(base, x, x0, n, memo), float(exponent))
+
+    elif len(expr.args) == 1:
+        a = _taylor_series(expr.args[0], x, x0, n, memo)
+        func = expr.func
+
+        if func == sp.exp:
+            result = _series_exp(a)
+        elif func == sp.log:
+            if a[0] <= 0:
+                raise ValueError("La función no es analítica en x0 (logaritmo de un valor no positivo)")
+            result = _series_compose(a, math.log(a[0]), _series_div(one, a))
+        elif func in (sp.sin, sp.cos, sp.tan):
+            sin_a, cos_a = _series_sin_cos(a)
+            result = {sp.sin: sin_a, sp.cos: cos_a}.get(func)
+            if result is None:
+                result = _series_div(sin_a, cos_a)
+        elif func in (sp.sinh, sp.cosh, sp.tanh):
+            sinh_a, cosh_a = _series_sin_cos(a, hyperbolic=True)
+            result = {sp.sinh: sinh_a, sp.cosh: cosh_a}.get(func)
+            if result is None:
+                result = _series_div(sinh_a, cosh_a)
+        elif func == sp.atan:
+            result = _series_compose(a, math.atan(a[0]), _series_div(one, one + _series_mul(a, a)))
+        elif func in (sp.asin, sp.acos):
+            d = _series_pow(one - _series_mul(a, a), -0.5)
+            if func == sp.asin:
+                result = _series_compose(a, math.asin(a[0]), d)
+            else:
+                result = _series_compose(a, math.acos(a[0]), -d)
+        elif func == sp.Abs:
+            if a[0] == 0:
+                raise ValueError("La función no es analítica en x0 (valor absoluto de 0)")
+            result = math.copysign(1.0, a[0]) * a
+        else:
+            raise NotImplementedError(f"Sin regla de diferenciación automática para {func}")
+
+    else:
+        raise NotImplementedError(f"Sin regla de diferenciación automática para {expr.func}")
+
+    memo[expr] = result
+    return result
+
 
 # ============================================================
 #   POLINOMIO DE TAYLOR
 # ============================================================
 
-def taylor(f, x0, n):
+def taylor_coefficients(f, x0, n, method='ad'):
+    """
+    Calcula el vector de coeficientes c_k = f^(k)(x0) / k! del polinomio
+    de Taylor de grado n, de modo que T(x) = Σ c_k·(x - x0)^k.
+
+    Parámetros:
+        f      : función simbólica de SymPy (o texto)
+        x0     : punto de aproximación
+        n      : grado del polinomio
+        method : forma de obtener los coeficientes
+                 - 'ad'       → diferenciación automática numérica en modo
+                                Taylor: propaga series truncadas por el árbol
+                                de la expresión, O(n²) sin crecimiento de
+                                expresiones (por defecto). Si la función usa
+                                algo sin regla, se recurre a 'symbolic'.
+                 - 'symbolic' → derivadas simbólicas incrementales: cada
+                                derivada se obtiene de la anterior
+
+    Retorna:
+        ndarray: coeficientes [c_0, c_1, ..., c_n]
+    """
+    x = symbols('x')
+    f = parse_expression(f)
+
+    if method == 'ad':
+        try:
+            return _taylor_series(f, x, float(x0), n, {}).copy()
+        except NotImplementedError:
+            method = 'symbolic'
+
+    if method != 'symbolic':
+        raise ValueError("method debe ser 'ad' o 'symbolic'")
+
+    return np.array([float(c) for c in _symbolic_coefficients(f, x, x0, n)])
+
+
+def _symbolic_coefficients(f, x, x0, n):
+    """
+    Coeficientes simbólicos f^(i)(x0) / i!. get_derivative obtiene cada
+    orden del anterior y los guarda en la caché compartida.
+    """
+    return [get_derivative(f, x, i).subs(x, x0) / math.factorial(i) for i in range(n + 1)]
+
+
+def taylor(f, x0, n, method='symbolic'):
     """
     Calcula el polinomio de Taylor de f en x0 de grado n.
 
     Parámetros:
-        f  : función simbólica de SymPy
-        x0 : punto de aproximación
-        n  : grado del polinomio
+        f      : función simbólica de SymPy
+        x0     : punto de aproximación
+        n      : grado del polinomio
+        method : 'symbolic' (coeficientes exactos, por defecto) o 'ad'
+                 (coeficientes numéricos, recomendado para grados altos);
+                 ver taylor_coefficients
 
     Retorna:
         t : polinomio de Taylor de grado n
     """
     x = symbols('x')
-    t = 0
 
     # CORRECCIÓN: incluir el término i = n
-    for i in range(n + 1):
-        term = diff(f, x, i).subs(x, x0) / math.factorial(i) * (x - x0)**i
-        t += term
+    if method == 'symbolic':
+        coefficients = _symbolic_coefficients(parse_expression(f), x, x0, n)
+    else:
+        coefficients = [Float(c) for c in taylor_coefficients(f, x0, n, method)]
+
+    t = 0
+    for i, c in enumerate(coefficients):
+        t += c * (x - x0)**i
 
     return t
 
 
+def taylor_polynomial(f, x0, n, method='ad'):
+    """
+    Retorna el polinomio de Taylor de f en x0 de grado n como Polynomial
+    (coeficientes numéricos y evaluación de Horner), sin construir la suma
+    simbólica.
+    """
+    return Polynomial(taylor_coefficients(f, x0, n, method), x0)
+
+
+def _taylor_values(t, x, x0=None):
+    """
+    Evalúa el polinomio de Taylor t en x. Un t simbólico se convierte en
+    Polynomial alrededor de x0 si se da; si no, se evalúa tal cual (sin
+    expandirlo alrededor de 0, que con x0 lejos de 0 pierde precisión).
+    """
+    if isinstance(t, Polynomial) or x0 is not None:
+        return as_polynomial(t, x0)(x)
+
+    t_numeric = compile_expression(t, 'x')
+    return np.broadcast_to(t_numeric(x), np.shape(x)).astype(float)
+
+
 # ============================================================
 #   ERROR ABSOLUTO
 # ============================================================
 
-def absolute_error(f, t, x):
+def absolute_error(f, t, x, x0=None):
     """
     Calcula el error absoluto |f(x) - T(x)|
 
     Parámetros:
         f : función original simbólica
-        t : polinomio de Taylor simbólico
-        x : punto donde se evalúa el error
+        t : polinomio de Taylor (Polynomial o expresión simbólica)
+        x : punto o arreglo de puntos donde se evalúa el error
+        x0 : punto de aproximación de un t simbólico (opcional)
 
     Retorna:
-        valor del error absoluto
+        valor del error absoluto (arreglo si x es un arreglo)
     """
-    x_sym = symbols('x')
-    return abs(f.subs(x_sym, x) - t.subs(x_sym, x))
+    f_numeric = compile_expression(f, 'x')
+
+    return np.abs(f_numeric(x) - _taylor_values(t, x, x0))
 
 
 # ============================================================
 #   ERROR RELATIVO
 # ============================================================
 
-def relative_error(f, t, x):
+def relative_error(f, t, x, x0=None):
     """
     Calcula el error relativo |(f(x) - T(x)) / f(x)|
 
     Parámetros:
         f : función original simbólica
-        t : polinomio de Taylor simbólico
-        x : punto donde se evalúa el error
+        t : polinomio de Taylor (Polynomial o expresión simbólica)
+        x : punto o arreglo de puntos donde se evalúa el error
+        x0 : punto de aproximación de un t simbólico (opcional)
 
     Retorna:
-        valor del error relativo
+        valor del error relativo (infinito donde f(x) = 0)
     """
-    x_sym = symbols('x')
-    real_value = f.subs(x_sym, x)
+    f_numeric = compile_expression(f, 'x')
 
-    if real_value == 0:
-        return float('inf')  # evita división por 0
+    real_value = np.broadcast_to(f_numeric(x), np.shape(x)).astype(float)
+    approx = _taylor_values(t, x, x0)
+
+    # evita división por 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        error = np.where(real_value == 0, np.inf, np.abs((real_value - approx) / real_value))
+
+    return error if error.ndim else float(error)
+
+
+# ============================================================
+#   MAPA DE ERROR (GRADO x PUNTO)
+# ============================================================
 
-    return abs((real_value - t.subs(x_sym, x)) / real_value)
+def taylor_error_map(f, x0, x_values, degrees, method='ad'):
+    """
+    Calcula los errores absoluto y relativo del polinomio de Taylor de f en
+    x0 para varios grados y muchos puntos en una sola pasada vectorizada.
+
+    Los coeficientes se calculan una vez para el grado máximo; las sumas
+    parciales de todos los grados salen de una suma acumulada de los
+    términos c_k·(x - x0)^k.
+
+    Parámetros:
+        f        : función simbólica de SymPy (o texto)
+        x0       : punto de aproximación
+        x_values : arreglo de puntos de evaluación
+        degrees  : grados a comparar (p. ej. range(1, 21))
+        method   : forma de obtener los coeficientes (ver taylor_coefficients)
+
+    Retorna:
+        tuple: (abs_error, rel_error), arreglos de forma (len(degrees), len(x_values))
+    """
+    x_values = np.asarray(x_values, dtype=float)
+    degrees = np.asarray(degrees, dtype=int)
+
+    coefficients = taylor_coefficients(f, x0, int(degrees.max()), method)
+
+    # Términos c_k·(x - x0)^k con potencias acumuladas y sumas parciales por grado
+    t = x_values - x0
+    terms = np.empty((len(coefficients), len(x_values)))
+    power = np.ones_like(t)
+    for k, c in enumerate(coefficients):
+        terms[k] = c * power
+        power = power * t
+    partial_sums = np.cumsum(terms, axis=0)[degrees]
+
+    f_values = np.broadcast_to(compile_expression(f, 'x')(x_values), x_values.shape)
+    abs_error = np.abs(f_values - partial_sums)
+
+    # evita división por 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rel_error = np.where(f_values == 0, np.inf, abs_error / np.abs(f_values))
+
+    return abs_error, rel_error
+
+
+def graph_taylor_error_map(x_values, degrees, error, x0=None):
+    """
+    Gráfica el mapa de calor de log10(error) por grado y punto de evaluación.
+
+    Parámetros:
+        x_values : puntos de evaluación
+        degrees  : grados evaluados
+        error    : arreglo (len(degrees), len(x_values)) de taylor_error_map
+        x0       : punto de aproximación (opcional, se marca con una línea)
+    """
+    with np.errstate(divide='ignore'):
+        log_error = np.log10(error)
+
+    plt.figure()
+    plt.pcolormesh(x_values, degrees, log_error, shading='auto', cmap='viridis')
+    plt.colorbar(label="log10(error)")
+
+    if x0 is not None:
+        plt.axvline(x0, color='white', linestyle='--', label="Punto x0")
+        plt.legend()
+
+    plt.title("Error del Polinomio de Taylor por grado y punto")
+    plt.xlabel("x")
+    plt.ylabel("Grado n")
+    plt.show()
 
 
 # ============================================================
@@ -86,7 +411,7 @@ def graph_taylor(f, t, x0, x_range=None):
 
     Parámetros:
         f       : función simbólica
-        t       : polinomio de Taylor simbólico
+        t       : polinomio de Taylor (Polynomial o expresión simbólica)
         x0      : punto de aproximación
         x_range : tupla (xmin, xmax) opcional
     """
@@ -100,8 +425,8 @@ def graph_taylor(f, t, x0, x_range=None):
     x_vals = np.linspace(x_range[0], x_range[1], 500)
 
     # convertir a funciones numéricas
-    f_numeric = lambdify(x, f, 'numpy')
-    t_numeric = lambdify(x, t, 'numpy')
+    f_numeric = compile_expression(f, x)
+    t_numeric = as_polynomial(t, x0)
 
     # evaluar
     f_vals = f_numeric(x_vals)
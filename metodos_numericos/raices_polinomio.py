@@ -0,0 +1,214 @@
+import numpy as np
+import sympy as sp
+
+from metodos_numericos.cache_expresiones import parse_expression
+
+
+def polynomial_coefficients(f, variable='x'):
+    """
+    Detecta si f es un polinomio en variable con coeficientes numéricos.
+
+    Parámetros:
+        f (str o expresión de SymPy): Función.
+        variable (str): Variable del polinomio.
+
+    Retorna:
+        ndarray o None: Coeficientes [a_n, ..., a_1, a_0] (de mayor a menor
+        grado, como np.roots), o None si f no es un polinomio de grado ≥ 1.
+    """
+    x = sp.Symbol(variable)
+    expr = parse_expression(f)
+
+    if expr.free_symbols != {x} or not expr.is_polynomial(x):
+        return None
+
+    coefficients = sp.Poly(expr, x).all_coeffs()
+
+    if len(coefficients) < 2 or not all(c.is_number for c in coefficients):
+        return None
+
+    return np.array([complex(c) for c in coefficients])
+
+
+def _newton_polish(coefficients, roots, tol, max_steps=50):
+    """
+    Pule raíces con pasos de Newton sobre el polinomio; cada raíz se
+    detiene cuando el paso es menor que tol (relativo a su módulo) o
+    cuando un paso ya no reduce |p(z)|.
+    """
+    roots = roots.copy()
+    derivative = np.polyder(coefficients)
+    active = np.ones(len(roots), dtype=bool)
+
+    for _ in range(max_steps):
+        index = np.flatnonzero(active)
+
+        if len(index) == 0:
+            break
+
+        z = roots[index]
+        p_values = np.polyval(coefficients, z)
+
+        with np.errstate(all='ignore'):
+            step = p_values / np.polyval(derivative, z)
+            candidate = z - step
+
+        better = np.isfinite(candidate) & (np.abs(np.polyval(coefficients, candidate)) < np.abs(p_values))
+        roots[index[better]] = candidate[better]
+
+        small = np.abs(step) <= tol * np.maximum(1.0, np.abs(z))
+        active[index[~better | small]] = False
+
+    return roots
+
+
+def _close_groups(roots, radius):
+    """
+    Agrupa las raíces que quedan a menos de radius (relativo a su módulo)
+    unas de otras, encadenando vecinos.
+    """
+    scale = np.maximum(1.0, np.abs(roots))
+    close = np.abs(roots[:, np.newaxis] - roots[np.newaxis, :]) <= radius * scale[:, np.newaxis]
+    unvisited = set(range(len(roots)))
+    groups = []
+
+    while unvisited:
+        pending = [unvisited.pop()]
+        group = []
+
+        while pending:
+            i = pending.pop()
+            group.append(i)
+            neighbours = [j for j in np.flatnonzero(close[i]) if j in unvisited]
+            unvisited.difference_update(neighbours)
+            pending.extend(neighbours)
+
+        groups.append(sorted(group))
+
+    return groups
+
+
+def _merge_multiple_roots(coefficients, roots, radius):
+    """
+    Una raíz de multiplicidad m sale de la matriz compañera como m valores
+    propios dispersos alrededor de ella (a distancia ~ eps^(1/m)), a veces
+    como pares complejos espurios. Cada grupo de raíces cercanas se
+    reemplaza por su promedio pulido con Newton sobre p^(m-1), que tiene ahí
+    una raíz simple, siempre que p, p', ..., p^(m-1) se anulen en ese punto
+    dentro del redondeo. Si no, el grupo se vuelve a partir con la mitad
+    del radio (p. ej. una raíz doble junto a otra simple cercana).
+
+    Retorna:
+        tuple: (raíces, máscara de las que quedaron fusionadas)
+    """
+    eps = np.finfo(float).eps
+    merged = np.zeros(len(roots), dtype=bool)
+    roots = roots.copy()
+    pending = [(np.arange(len(roots)), radius)]
+
+    while pending:
+        indices, group_radius = pending.pop()
+
+        for group in _close_groups(roots[indices], group_radius):
+            group = indices[group]
+            m = len(group)
+
+            if m == 1:
+                continue
+
+            center = roots[group].mean(keepdims=True)
+            center = _newton_polish(np.polyder(coefficients, m - 1), center, 0.0)[0]
+
+            vanishes = all(
+                abs(np.polyval(np.polyder(coefficients, j), center))
+                <= 100 * m * eps * np.polyval(np.abs(np.polyder(coefficients, j)), abs(center))
+                for j in range(m)
+            )
+
+            if vanishes:
+                roots[group] = center
+                merged[group] = True
+            elif group_radius > eps:
+                pending.append((group, group_radius / 2))
+
+    return roots, merged
+
+
+def polynomial_roots(f, tol=1e-12, variable='x', radius=None):
+    """
+    Calcula todas las raíces (reales y complejas) de un polinomio en una
+    sola llamada, como valores propios de su matriz compañera (np.roots),
+    en O(n³).
+
+    Las raíces múltiples se detectan y se reemplazan por un único valor
+    preciso repetido según su multiplicidad (ver _merge_multiple_roots);
+    las simples se pulen con pasos de Newton hasta que el paso es menor
+    que tol.
+
+    Parámetros:
+        f (str o expresión de SymPy): Polinomio.
+        tol (float): Tolerancia del pulido de Newton.
+        variable (str): Variable del polinomio.
+        radius (float): Distancia relativa bajo la cual las raíces se
+            consideran candidatas a ser una raíz múltiple. Por defecto
+            10·eps^(1/n), con n el grado, que cubre la dispersión de una
+            raíz de cualquier multiplicidad posible.
+
+    Retorna:
+        ndarray: Raíces complejas (las múltiples repetidas), ordenadas por
+        parte real.
+
+    Lanza:
+        ValueError: si f no es un polinomio.
+    """
+    coefficients = polynomial_coefficients(f, variable)
+
+    if coefficients is None:
+        raise ValueError("La función no es un polinomio")
+
+    if np.all(coefficients.imag == 0):
+        coefficients = coefficients.real
+
+    roots = np.roots(coefficients).astype(complex)
+
+    if radius is None:
+        radius = max(1e-3, 10 * np.finfo(float).eps ** (1 / max(len(roots), 1)))
+
+    roots, merged = _merge_multiple_roots(coefficients, roots, radius)
+    roots[~merged] = _newton_polish(coefficients, roots[~merged], tol)
+
+    return roots[np.lexsort((roots.imag, roots.real))]
+
+
+def _is_real(roots, tol=1e-10):
+    """Máscara de las raíces con parte imaginaria despreciable (relativa a su módulo)."""
+    return np.abs(roots.imag) <= tol * np.maximum(1.0, np.abs(roots))
+
+
+def real_roots(roots, tol=1e-10):
+    """
+    Retorna las raíces reales como números reales ordenados.
+    """
+    roots = np.asarray(roots, dtype=complex)
+
+    return np.sort(roots[_is_real(roots, tol)].real)
+
+
+def print_polynomial_roots(roots):
+    """
+    Imprime las raíces de un polinomio separando reales y complejas, con su
+    multiplicidad cuando se repiten.
+    """
+    real, real_counts = np.unique(real_roots(roots), return_counts=True)
+    complex_roots, complex_counts = np.unique(roots[~_is_real(roots)], return_counts=True)
+
+    print("\nRaíces del polinomio (valores propios de la matriz compañera)")
+    print("-" * 60)
+
+    for i, (root, count) in enumerate(zip(real, real_counts)):
+        multiplicity = f" (multiplicidad {count})" if count > 1 else ""
+        print(f"Raíz real {i + 1}: {root}{multiplicity}")
+
+    for root, count in zip(complex_roots, complex_counts):
+        multiplicity = f" (multiplicidad {count})" if count > 1 else ""
+        print(f"Raíz compleja: {root.real} {'+' if root.imag >= 0 else '-'} {abs(root.imag)}i{multiplicity}")
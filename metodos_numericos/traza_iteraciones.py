@@ -0,0 +1,190 @@
+import os
+
+import numpy as np
+
+
+class IterationTrace:
+    """
+    Traza de iteraciones común a todos los métodos, guardada por columnas en
+    un arreglo estructurado de NumPy en lugar de listas de objetos de Python.
+
+    Cada fila tiene los campos:
+        - iteration → número de iteración
+        - iterate   → aproximación (escalar o vector de longitud dimension)
+        - residual  → residuo (f(x) o norma de b - A·x, según el método)
+        - step      → tamaño del último paso
+        - error     → medida de error que el método compara con tol
+
+    El arreglo se reserva por adelantado y duplica su capacidad al llenarse,
+    así que agregar una fila cuesta O(1) amortizado. Los campos que un método
+    no calcula quedan en NaN.
+
+    Parámetros:
+        dimension (int): longitud de cada aproximación; si es None se toma
+            de la primera fila agregada.
+        capacity (int): número de filas reservadas inicialmente.
+    """
+
+    def __init__(self, dimension=None, capacity=64):
+        self._data = None
+        self._capacity = max(1, capacity)
+        self.size = 0
+
+        if dimension is not None:
+            self._allocate(dimension)
+
+    @staticmethod
+    def _dtype(dimension):
+        iterate_shape = () if dimension == 1 else (dimension,)
+
+        return np.dtype([
+            ('iteration', np.int64),
+            ('iterate', np.float64, iterate_shape),
+            ('residual', np.float64),
+            ('step', np.float64),
+            ('error', np.float64)
+        ])
+
+    def _allocate(self, dimension):
+        self._data = np.empty(self._capacity, dtype=self._dtype(dimension))
+
+    @property
+    def dimension(self):
+        if self._data is None:
+            return None
+
+        shape = self._data.dtype['iterate'].shape
+        return shape[0] if shape else 1
+
+    def append(self, iteration, iterate, residual=np.nan, step=np.nan, error=np.nan):
+        """
+        Agrega una fila a la traza.
+        """
+        iterate = np.asarray(iterate, dtype=float)
+
+        if self._data is None:
+            self._allocate(iterate.size)
+
+        if self.size == len(self._data):
+            grown = np.empty(2 * len(self._data), dtype=self._data.dtype)
+            grown[:self.size] = self._data[:self.size]
+            self._data = grown
+
+        self._data[self.size] = (iteration, iterate, residual, step, error)
+        self.size += 1
+
+    @property
+    def data(self):
+        """Vista (sin copia) de las filas ocupadas del arreglo estructurado."""
+        if self._data is None:
+            return np.empty(0, dtype=self._dtype(1))
+
+        return self._data[:self.size]
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, key):
+        """
+        trace['residual'] → columna completa; trace[k] → fila k.
+        """
+        return self.data[key]
+
+    @property
+    def nbytes(self):
+        return self.data.nbytes
+
+    # ============================================================
+    #   EXPORTACIÓN
+    # ============================================================
+
+    def save_npz(self, path, compressed=False):
+        """
+        Guarda cada campo como un arreglo dentro de un .npz (sin pickle).
+        """
+        save = np.savez_compressed if compressed else np.savez
+        save(path, **{name: self.data[name] for name in self.data.dtype.names})
+
+    def save_csv(self, path, chunk_size=10000):
+        """
+        Escribe la traza en CSV por bloques de chunk_size filas, sin armar
+        el texto completo en memoria. Las aproximaciones vectoriales ocupan
+        una columna por componente (x0, x1, ...).
+        """
+        dimension = self.dimension or 1
+        iterate_columns = ['iterate'] if dimension == 1 else [f'x{i}' for i in range(dimension)]
+        header = ','.join(['iteration'] + iterate_columns + ['residual', 'step', 'error'])
+        fmt = ['%d'] + ['%.17g'] * (dimension + 3)
+
+        with open(path, 'w') as handle:
+            handle.write(header + '\n')
+
+            for start in range(0, self.size, chunk_size):
+                chunk = self.data[start:start + chunk_size]
+                columns = np.column_stack([
+                    chunk['iteration'],
+                    chunk['iterate'].reshape(len(chunk), -1),
+                    chunk['residual'],
+                    chunk['step'],
+                    chunk['error']
+                ])
+                np.savetxt(handle, columns, fmt=fmt, delimiter=',')
+
+    def save_memmap(self, path):
+        """
+        Guarda la traza como .npy y retorna el arreglo mapeado en memoria
+        del archivo, que puede seguir leyéndose sin cargarlo completo.
+        """
+        mapped = np.lib.format.open_memmap(path, mode='w+', dtype=self.data.dtype, shape=(self.size,))
+        mapped[:] = self.data
+        mapped.flush()
+
+        return mapped
+
+    def save(self, path):
+        """
+        Guarda la traza en el formato que indica la extensión de path:
+        .npz (save_npz), .csv (save_csv) o .npy (save_memmap).
+        """
+        extension = os.path.splitext(path)[1].lower()
+
+        if extension == '.npz':
+            self.save_npz(path)
+        elif extension == '.csv':
+            self.save_csv(path)
+        elif extension == '.npy':
+            self.save_memmap(path)
+        else:
+            raise ValueError(f"Formato de archivo no soportado: {extension}")
+
+    @classmethod
+    def load(cls, path):
+        """
+        Carga una traza guardada con save_npz o save_memmap (.npy, que se abre
+        mapeado en memoria y sin copia).
+        """
+        extension = os.path.splitext(path)[1].lower()
+
+        if extension == '.npy':
+            data = np.load(path, mmap_mode='r')
+
+        elif extension == '.npz':
+            with np.load(path) as archive:
+                iterate = archive['iterate']
+                dimension = iterate.shape[1] if iterate.ndim > 1 else 1
+                data = np.empty(len(iterate), dtype=cls._dtype(dimension))
+
+                for name in data.dtype.names:
+                    data[name] = archive[name]
+
+        else:
+            raise ValueError(f"Formato de archivo no soportado: {extension}")
+
+        trace = cls()
+        trace._data = data
+        trace.size = len(data)
+
+        return trace
+
+    def __repr__(self):
+        return f"IterationTrace(size={self.size}, dimension={self.dimension})"
@@ -11,6 +11,9 @@ from metodos_numericos.newton_raphson import newton_raphson
 from metodos_numericos.diferencias_finitas import solve_finite_differences
 from metodos_numericos.ecuaciones_no_lineales import newton_raphson_n_variables, graph_nonlinear_equations
 from metodos_numericos.ecuaciones_lineales import jacobi_method
+from metodos_numericos.lectura_matrices import parse_matrix
+from metodos_numericos.cache_expresiones import parse_expression, compile_expression
+from metodos_numericos.polinomio import Polynomial
 
 
 class NumericalApp(tk.Tk):
@@ -58,7 +61,7 @@ class NumericalApp(tk.Tk):
         try:
             self.taylor_result.delete("1.0", tk.END)
 
-            f = sp.sympify(self.taylor_entries[0].get())
+            f = parse_expression(self.taylor_entries[0].get())
             x0 = float(self.taylor_entries[1].get())
             n = int(self.taylor_entries[2].get())
             x_val = float(self.taylor_entries[3].get())
@@ -67,8 +70,9 @@ class NumericalApp(tk.Tk):
             x_range = (x0 - x_range_val, x0 + x_range_val)
 
             t_poly = taylor(f, x0, n)
-            err_abs = absolute_error(f, t_poly, x_val)
-            err_rel = relative_error(f, t_poly, x_val)
+            t_numeric = Polynomial.from_sympy(t_poly, x0)
+            err_abs = absolute_error(f, t_numeric, x_val)
+            err_rel = relative_error(f, t_numeric, x_val)
 
             self.taylor_result.insert(tk.END, f"Polinomio de Taylor: {t_poly}\n")
             self.taylor_result.insert(tk.END, f"Error absoluto: {err_abs}\n")
@@ -80,8 +84,8 @@ class NumericalApp(tk.Tk):
 
             fig, ax = plt.subplots()
             x_sym = sp.symbols("x")
-            f_lamb = sp.lambdify(x_sym, f, "numpy")
-            t_lamb = sp.lambdify(x_sym, t_poly, "numpy")
+            f_lamb = compile_expression(f, x_sym)
+            t_lamb = t_numeric
 
             xs = np.linspace(x_range[0], x_range[1], 500)
 
@@ -177,9 +181,9 @@ class NumericalApp(tk.Tk):
             self.fd_result.delete("1.0", tk.END)
 
             x = sp.symbols("x")
-            px = sp.lambdify(x, sp.sympify(self.fd_entries[0].get()), 'numpy')
-            qx = sp.lambdify(x, sp.sympify(self.fd_entries[1].get()), 'numpy')
-            rx = sp.lambdify(x, sp.sympify(self.fd_entries[2].get()), 'numpy')
+            px = compile_expression(self.fd_entries[0].get(), x)
+            qx = compile_expression(self.fd_entries[1].get(), x)
+            rx = compile_expression(self.fd_entries[2].get(), x)
 
             a = float(self.fd_entries[3].get())
             b = float(self.fd_entries[4].get())
@@ -275,7 +279,7 @@ class NumericalApp(tk.Tk):
         frame_inputs = ttk.LabelFrame(self.jacobi_tab, text="Datos")
         frame_inputs.pack(fill="x", padx=10, pady=10)
 
-        labels = ["Matriz A:", "Vector b:", "Tolerancia:", "Iteraciones:"]
+        labels = ["Matriz A (o archivo):", "Vector b (o archivo):", "Tolerancia:", "Iteraciones:"]
         self.jacobi_entries = []
 
         for i, t in enumerate(labels):
@@ -284,8 +288,20 @@ class NumericalApp(tk.Tk):
             e.grid(row=i, column=1, padx=5, pady=5)
             self.jacobi_entries.append(e)
 
+        # Política del historial de iteraciones
+        ttk.Label(frame_inputs, text="Historial:").grid(row=len(labels), column=0)
+        self.jacobi_history = ttk.Combobox(frame_inputs, values=["all", "last", "every", "ring"],
+                                           state="readonly")
+        self.jacobi_history.current(0)
+        self.jacobi_history.grid(row=len(labels), column=1, padx=5, pady=5)
+
+        ttk.Label(frame_inputs, text="k (every / ring):").grid(row=len(labels) + 1, column=0)
+        self.jacobi_history_size = ttk.Entry(frame_inputs, width=40)
+        self.jacobi_history_size.insert(0, "10")
+        self.jacobi_history_size.grid(row=len(labels) + 1, column=1, padx=5, pady=5)
+
         ttk.Button(frame_inputs, text="Calcular", command=self.calculate_jacobi).grid(
-            row=len(labels), column=0, columnspan=2, pady=10
+            row=len(labels) + 2, column=0, columnspan=2, pady=10
         )
 
         self.jacobi_result = tk.Text(self.jacobi_tab, height=10)
@@ -295,15 +311,22 @@ class NumericalApp(tk.Tk):
         try:
             self.jacobi_result.delete("1.0", tk.END)
 
-            A = sp.Matrix(eval(self.jacobi_entries[0].get()))
-            b = sp.Matrix(eval(self.jacobi_entries[1].get()))
+            A = parse_matrix(self.jacobi_entries[0].get())
+            b = parse_matrix(self.jacobi_entries[1].get())
             tol = float(self.jacobi_entries[2].get())
             n = int(self.jacobi_entries[3].get())
+            history = self.jacobi_history.get()
+            history_size = int(self.jacobi_history_size.get())
 
-            result = jacobi_method(A, b, tol, n)
+            result, residuals = jacobi_method(A, b, tol, n, history=history,
+                                              history_size=history_size, return_residuals=True)
+
+            label = "Iter" if history == "all" else "Aproximación"
 
             for i, row in enumerate(result):
-                self.jacobi_result.insert(tk.END, f"Iter {i}: {row}\n")
+                self.jacobi_result.insert(tk.END, f"{label} {i}: {row}\n")
+
+            self.jacobi_result.insert(tk.END, f"Iteraciones: {len(residuals)}\n")
 
         except Exception as e:
             messagebox.showerror("Error", str(e))